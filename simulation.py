@@ -40,7 +40,10 @@ import asyncio
 import uuid
 from dataclasses import dataclass
 from decimal import Decimal
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Coroutine
 
 # ---------------------------------------------------------------------------
 # Configure structured logging BEFORE importing app modules
@@ -582,6 +585,16 @@ async def run_scenario(num: int, use_sqlite: bool = False, dry_run: bool = False
         await shutdown_database()
 
 
+def _run(coro: Coroutine[Any, Any, None]) -> None:
+    """Run on uvloop when installed — the same loop uvicorn[standard] serves the API on."""
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(coro)
+    else:
+        uvloop.run(coro)
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Agentic Clearinghouse Simulation")
     parser.add_argument(
@@ -603,6 +616,6 @@ if __name__ == "__main__":
     args = parser.parse_args()
 
     if args.scenario == 0:
-        asyncio.run(run_all(use_sqlite=args.sqlite, dry_run=args.dry_run))
+        _run(run_all(use_sqlite=args.sqlite, dry_run=args.dry_run))
     else:
-        asyncio.run(run_scenario(args.scenario, use_sqlite=args.sqlite, dry_run=args.dry_run))
+        _run(run_scenario(args.scenario, use_sqlite=args.sqlite, dry_run=args.dry_run))
@@ -16,6 +16,7 @@ from agentic_clearinghouse.infrastructure.database.repositories import (
     EscrowRepository,
     EventRepository,
     SubmissionRepository,
+    get_repositories,
 )
 from agentic_clearinghouse.infrastructure.redis_client import get_redis
 
@@ -36,21 +37,21 @@ async def get_escrow_repo(
     session: AsyncSession = Depends(get_db_session),
 ) -> EscrowRepository:
     """Provide an EscrowRepository bound to the current session."""
-    return EscrowRepository(session)
+    return get_repositories(session).escrow
 
 
 async def get_submission_repo(
     session: AsyncSession = Depends(get_db_session),
 ) -> SubmissionRepository:
     """Provide a SubmissionRepository bound to the current session."""
-    return SubmissionRepository(session)
+    return get_repositories(session).submissions
 
 
 async def get_event_repo(
     session: AsyncSession = Depends(get_db_session),
 ) -> EventRepository:
     """Provide an EventRepository bound to the current session."""
-    return EventRepository(session)
+    return get_repositories(session).events
 
 
 def get_redis_client() -> aioredis.Redis:
@@ -45,6 +45,13 @@ class Settings(BaseSettings):
     db_pool_timeout: int = 30
     db_echo_sql: bool = False
 
+    # --- Audit Event Log ---
+    # Write escrow_events through a background batch writer instead of inline.
+    event_log_async: bool = True
+    event_log_batch_size: int = 100
+    event_log_flush_interval_ms: int = 20
+    event_log_queue_high_watermark: int = 10_000  # above this, fall back to inline inserts
+
     # --- Redis ---
     redis_url: str = "redis://localhost:6379/0"
     redis_idempotency_ttl_seconds: int = 86400  # 24 hours
@@ -52,6 +59,13 @@ class Settings(BaseSettings):
     # --- E2B Sandbox ---
     e2b_api_key: str = ""
     e2b_timeout_seconds: int = 30
+    # Sandboxes pre-created ahead of demand (single-use); 0 disables the warm pool.
+    # Off by default: idle sandboxes are billed and expire after their lifetime, so
+    # the pool only saves cold starts when traffic arrives well within it.
+    e2b_pool_min_warm: int = 0
+    e2b_pool_sandbox_lifetime_seconds: int = 300  # E2B-side lifetime of an idle warm sandbox
+    # Comma-separated templates pooled besides the default; others boot on demand.
+    e2b_pool_templates: str = ""
 
     # --- LLM / LiteLLM ---
     # Supports any LiteLLM-compatible model string.
@@ -80,6 +94,11 @@ class Settings(BaseSettings):
     def is_development(self) -> bool:
         return self.app_env == "development"
 
+    @property
+    def e2b_pool_template_list(self) -> list[str]:
+        """Parse comma-separated pooled E2B templates into a list."""
+        return [t.strip() for t in self.e2b_pool_templates.split(",") if t.strip()]
+
     @property
     def litellm_fallback_model_list(self) -> list[str]:
         """Parse comma-separated fallback models into a list."""
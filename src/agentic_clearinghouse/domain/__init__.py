@@ -11,6 +11,7 @@ from agentic_clearinghouse.domain.exceptions import (
     InvalidStateTransitionError,
 )
 from agentic_clearinghouse.domain.state_machine import (
+    TRANSITION_TABLE,
     EscrowStateMachine,
     validate_transition,
 )
@@ -28,6 +29,7 @@ __all__ = [
     "ContractNotFoundError",
     "InvalidStateTransitionError",
     "EscrowStateMachine",
+    "TRANSITION_TABLE",
     "validate_transition",
     "VerificationRequest",
     "VerificationResult",
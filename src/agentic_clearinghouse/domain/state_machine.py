@@ -20,12 +20,17 @@ Transition table:
     VERIFYING     -> FAILED           (max_retries_exceeded)
     DISPUTED      -> COMPLETED        (dispute_resolved_for_worker)
     DISPUTED      -> FAILED           (dispute_resolved_for_buyer)
+
+TRANSITION_TABLE flattens the same graph into a (status, event) -> new status
+dict, built once at import, for hot paths that only need to validate a move.
 """
 
 from __future__ import annotations
 
 from statemachine import State, StateMachine
 
+from agentic_clearinghouse.domain.enums import EscrowStatus
+
 
 class EscrowStateMachine(StateMachine):
     """State machine that guards escrow contract lifecycle transitions.
@@ -98,6 +103,23 @@ class EscrowStateMachine(StateMachine):
         return [event.name for event in self.allowed_events]
 
 
+def _build_transition_table() -> dict[tuple[str, str], EscrowStatus]:
+    """Flatten EscrowStateMachine into {(status, event_name): new_status}.
+
+    Exact because the machine has no guards/conditions: an event is allowed
+    from a state iff that state declares a transition for it.
+    """
+    return {
+        (state.value, event.name): EscrowStatus(transition.target.value)
+        for state in EscrowStateMachine.states
+        for transition in state.transitions
+        for event in transition.events
+    }
+
+
+TRANSITION_TABLE: dict[tuple[str, str], EscrowStatus] = _build_transition_table()
+
+
 def validate_transition(current_status: str, event_name: str) -> str:
     """Validate a state transition and return the new status.
 
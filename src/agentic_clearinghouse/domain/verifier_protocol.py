@@ -10,7 +10,10 @@ The domain layer has ZERO imports from E2B, LiteLLM, or any external service.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Protocol, runtime_checkable
+from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
 
 
 @dataclass(frozen=True)
@@ -38,14 +41,15 @@ class VerificationResult:
         is_valid: Whether the work meets the criteria.
         score: Optional numeric score (0.0 - 1.0) for semantic verification.
         details: Human-readable explanation of the result.
-        logs: Raw logs from execution (stdout, stderr, LLM response).
+        logs: Raw logs from execution (stdout, stderr, LLM response). May be
+            a read-only mapping when the result instance is shared.
         error: Error message if the verifier itself failed (not the work).
     """
 
     is_valid: bool
     score: float | None = None
     details: str = ""
-    logs: dict = field(default_factory=dict)
+    logs: Mapping[str, Any] = field(default_factory=dict)
     error: str | None = None
 
     def to_dict(self) -> dict:
@@ -54,7 +58,7 @@ class VerificationResult:
             "is_valid": self.is_valid,
             "score": self.score,
             "details": self.details,
-            "logs": self.logs,
+            "logs": dict(self.logs),
             "error": self.error,
         }
 
@@ -5,6 +5,10 @@ from agentic_clearinghouse.infrastructure.database.engine import (
     get_async_session,
     init_db,
 )
+from agentic_clearinghouse.infrastructure.database.event_writer import (
+    start_event_writer,
+    stop_event_writer,
+)
 from agentic_clearinghouse.infrastructure.database.orm_models import (
     Base,
     EscrowContract,
@@ -14,7 +18,9 @@ from agentic_clearinghouse.infrastructure.database.orm_models import (
 from agentic_clearinghouse.infrastructure.database.repositories import (
     EscrowRepository,
     EventRepository,
+    Repositories,
     SubmissionRepository,
+    get_repositories,
 )
 
 __all__ = [
@@ -25,7 +31,11 @@ __all__ = [
     "EscrowRepository",
     "EventRepository",
     "SubmissionRepository",
+    "Repositories",
+    "get_repositories",
     "get_async_session",
     "init_db",
     "close_db",
+    "start_event_writer",
+    "stop_event_writer",
 ]
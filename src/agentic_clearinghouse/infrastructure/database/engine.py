@@ -14,8 +14,11 @@ Usage in FastAPI:
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import json
+import re
+from typing import TYPE_CHECKING, Any
 
+import orjson
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
@@ -30,6 +33,34 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+# 19+ digits may be an integer outside 64 bits, which orjson.loads turns into a float
+_LONG_NUMBER_RE = re.compile(r"\d{19,}")
+
+
+def _json_serializer(obj: object) -> str:
+    """Serialize JSON/JSONB bind values with orjson (SQLAlchemy expects str).
+
+    orjson rejects integers beyond 64 bits, which buyer-defined configs can
+    hold (e.g. a schema `maximum`), so those values fall back to json.dumps.
+    """
+    try:
+        # OPT_NON_STR_KEYS keeps json.dumps' behaviour of coercing int/UUID dict keys
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+    except orjson.JSONEncodeError:
+        return json.dumps(obj)
+
+
+def _json_deserializer(value: str) -> Any:
+    """Parse JSON/JSONB column values with orjson.
+
+    Values that may hold an integer beyond 64 bits are parsed with json.loads
+    instead, since orjson would silently read them back as floats.
+    """
+    if _LONG_NUMBER_RE.search(value):
+        return json.loads(value)
+    return orjson.loads(value)
+
+
 # Module-level singletons (initialized in init_db)
 _engine = None
 _session_factory = None
@@ -47,6 +78,8 @@ def _get_engine():
             pool_timeout=settings.db_pool_timeout,
             pool_pre_ping=True,
             echo=settings.db_echo_sql,
+            json_serializer=_json_serializer,
+            json_deserializer=_json_deserializer,
         )
         logger.info(
             "database.engine_created",
@@ -0,0 +1,208 @@
+"""Background writer for the append-only audit event log.
+
+Transitions hand their audit rows to this writer instead of awaiting an
+INSERT on the request path. A single flusher task drains the queue and
+writes rows with one multi-row INSERT per batch, on its own session.
+
+Rows are buffered on the originating session and only enqueued once that
+session commits, so the FK to escrow_contracts always holds and a
+rolled-back transition never leaves an audit row behind.
+
+Fallbacks to the synchronous (same-transaction) INSERT:
+    - The writer is not running (tests, scripts, event_log_async=False).
+    - The queue is above event_log_queue_high_watermark (backpressure).
+
+Once a transition has committed its audit rows are never dropped: a failed
+batch is retried, then written row by row, and rows committed after the
+writer stopped are written by a one-off task that stop_event_writer awaits.
+
+Usage:
+    await start_event_writer()   # app startup, after init_db()
+    await stop_event_writer()    # app shutdown, before close_db() — drains the queue
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from sqlalchemy import event, insert
+from sqlalchemy.orm import Session
+
+from agentic_clearinghouse.config import get_settings
+from agentic_clearinghouse.infrastructure.database.engine import _get_session_factory
+from agentic_clearinghouse.infrastructure.database.orm_models import EscrowEvent
+from agentic_clearinghouse.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# session.info key holding rows waiting for the session to commit
+_PENDING_KEY = "pending_audit_events"
+
+# Module-level singletons (initialized in start_event_writer)
+_queue: asyncio.Queue[dict[str, Any] | None] | None = None
+_flusher: asyncio.Task[None] | None = None
+
+# Writes for rows committed after the writer stopped (awaited by stop_event_writer)
+_late_writes: set[asyncio.Task[None]] = set()
+
+EVENT_LOG_WRITE_ATTEMPTS = 3
+EVENT_LOG_RETRY_BACKOFF_SECONDS = 0.1
+
+
+def enqueue_after_commit(session: Any, row: dict[str, Any]) -> bool:
+    """Buffer an event row until `session` commits.
+
+    Args:
+        session: The AsyncSession (or Session) running the transition.
+        row: EscrowEvent column values keyed by ORM attribute name.
+
+    Returns:
+        False if the caller must insert the row synchronously instead.
+    """
+    if _queue is None:
+        return False
+    if _queue.qsize() >= get_settings().event_log_queue_high_watermark:
+        logger.warning("event_log.backpressure", queue_depth=_queue.qsize())
+        return False
+    # Rolling back a session that never began a transaction fires no events,
+    # so begin one now to make sure the rows are discarded with it
+    sync_session = getattr(session, "sync_session", session)
+    if not sync_session.in_transaction():
+        sync_session.begin()
+    session.info.setdefault(_PENDING_KEY, []).append(row)
+    return True
+
+
+@event.listens_for(Session, "after_commit")
+def _on_commit(session: Session) -> None:
+    """Release a committed session's buffered rows to the flusher."""
+    pending = session.info.pop(_PENDING_KEY, None)
+    if not pending:
+        return
+    if _queue is None:
+        # Writer stopped between record() and commit — nothing will drain the queue
+        _write_late(pending)
+        return
+    for row in pending:
+        _queue.put_nowait(row)
+
+
+@event.listens_for(Session, "after_rollback")
+def _on_rollback(session: Session) -> None:
+    """Discard rows buffered by a transaction that did not commit."""
+    session.info.pop(_PENDING_KEY, None)
+
+
+def _write_late(rows: list[dict[str, Any]]) -> None:
+    """Write rows committed after the writer stopped on a one-off task."""
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        logger.error("event_log.rows_lost", count=len(rows), rows=rows)
+        return
+    task = loop.create_task(_write_batch(rows), name="event-log-late-write")
+    _late_writes.add(task)
+    task.add_done_callback(_late_writes.discard)
+
+
+async def _insert(rows: list[dict[str, Any]]) -> None:
+    """Insert event rows in a single statement and commit."""
+    factory = _get_session_factory()
+    async with factory() as session:
+        try:
+            await session.execute(insert(EscrowEvent), rows)
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+
+
+async def _write_batch(rows: list[dict[str, Any]]) -> None:
+    """Write a batch of committed event rows without losing any of them.
+
+    The batch INSERT is retried with backoff; if it keeps failing the rows
+    are written one at a time so a single bad row cannot take the rest of
+    the batch with it. Rows that still fail are logged in full.
+    """
+    for attempt in range(1, EVENT_LOG_WRITE_ATTEMPTS + 1):
+        try:
+            await _insert(rows)
+            return
+        except Exception:
+            logger.warning(
+                "event_log.flush_failed", count=len(rows), attempt=attempt, exc_info=True
+            )
+            if attempt < EVENT_LOG_WRITE_ATTEMPTS:
+                await asyncio.sleep(EVENT_LOG_RETRY_BACKOFF_SECONDS * 2 ** (attempt - 1))
+
+    for row in rows:
+        try:
+            await _insert([row])
+        except Exception:
+            logger.exception("event_log.row_lost", row=row)
+
+
+def _drain(
+    queue: asyncio.Queue[dict[str, Any] | None],
+    batch: list[dict[str, Any]],
+    limit: int,
+) -> bool:
+    """Move queued rows into `batch` without waiting, up to `limit` rows.
+
+    Returns True if the shutdown sentinel was reached.
+    """
+    while len(batch) < limit and not queue.empty():
+        row = queue.get_nowait()
+        if row is None:
+            return True
+        batch.append(row)
+    return False
+
+
+async def _flush_loop(queue: asyncio.Queue[dict[str, Any] | None]) -> None:
+    """Write queued rows in batches until the shutdown sentinel is reached."""
+    settings = get_settings()
+    interval = settings.event_log_flush_interval_ms / 1000
+    while True:
+        first = await queue.get()
+        if first is None:
+            return
+        batch = [first]
+        await asyncio.sleep(interval)
+        stop = _drain(queue, batch, settings.event_log_batch_size)
+        await _write_batch(batch)
+        if stop:
+            return
+
+
+async def start_event_writer() -> None:
+    """Start the background flusher. Called during app startup."""
+    global _queue, _flusher
+    settings = get_settings()
+    if not settings.event_log_async or _flusher is not None:
+        return
+    _queue = asyncio.Queue()
+    _flusher = asyncio.create_task(_flush_loop(_queue), name="event-log-flusher")
+    logger.info(
+        "event_log.writer_started",
+        batch_size=settings.event_log_batch_size,
+        flush_interval_ms=settings.event_log_flush_interval_ms,
+    )
+
+
+async def stop_event_writer() -> None:
+    """Flush everything still queued and stop the flusher. Called during app shutdown.
+
+    Safe to call again: later calls wait for rows committed since the last stop.
+    """
+    global _queue, _flusher
+    if _flusher is not None and _queue is not None:
+        queue, flusher = _queue, _flusher
+        _queue, _flusher = None, None  # new events fall back to synchronous inserts
+        pending = queue.qsize()
+        queue.put_nowait(None)
+        await flusher
+        logger.info("event_log.writer_stopped", flushed=pending)
+    if _late_writes:
+        await asyncio.gather(*_late_writes)
@@ -19,6 +19,7 @@ from __future__ import annotations
 import uuid
 from datetime import UTC, datetime
 from decimal import Decimal  # noqa: TC003 - needed at runtime by SQLAlchemy Mapped[]
+from functools import cached_property
 
 from sqlalchemy import (
     Boolean,
@@ -194,6 +195,11 @@ class EscrowContract(Base):
         Index("idx_escrow_created_at", "created_at"),
     )
 
+    @cached_property
+    def id_str(self) -> str:
+        """String form of the id, computed once (the id is assigned on flush)."""
+        return str(self.id)
+
     def __repr__(self) -> str:
         return (
             f"<EscrowContract id={self.id} status={self.status} "
@@ -265,10 +271,16 @@ class WorkSubmission(Base):
 
     # --- Indexes ---
     __table_args__ = (
-        Index("idx_submission_contract", "contract_id"),
+        # Serves contract_id lookups and "latest submission" (backward index scan)
+        Index("idx_submission_contract_submitted_at", "contract_id", "submitted_at"),
         Index("idx_submission_submitted_at", "submitted_at"),
     )
 
+    @cached_property
+    def id_str(self) -> str:
+        """String form of the id, computed once (the id is assigned on flush)."""
+        return str(self.id)
+
     def __repr__(self) -> str:
         return (
             f"<WorkSubmission id={self.id} contract={self.contract_id} "
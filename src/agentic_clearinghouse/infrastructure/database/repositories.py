@@ -3,15 +3,20 @@
 Repositories encapsulate all SQL queries and provide a clean interface
 to the service layer. They accept an AsyncSession and never manage
 their own transactions (that's the caller's responsibility).
+
+Repositories are stateless wrappers around the session, so services share
+one set per session via get_repositories(session).
 """
 
 from __future__ import annotations
 
+import uuid
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 
 from sqlalchemy import select
 
+from agentic_clearinghouse.infrastructure.database.event_writer import enqueue_after_commit
 from agentic_clearinghouse.infrastructure.database.orm_models import (
     EscrowContract,
     EscrowEvent,
@@ -19,8 +24,6 @@ from agentic_clearinghouse.infrastructure.database.orm_models import (
 )
 
 if TYPE_CHECKING:
-    import uuid
-
     from sqlalchemy.ext.asyncio import AsyncSession
 
     from agentic_clearinghouse.domain.enums import EscrowStatus, EventType
@@ -39,11 +42,13 @@ class EscrowRepository:
         return contract
 
     async def get_by_id(self, contract_id: uuid.UUID) -> EscrowContract | None:
-        """Fetch a contract by its UUID."""
-        result = await self._session.execute(
-            select(EscrowContract).where(EscrowContract.id == contract_id)
-        )
-        return result.scalar_one_or_none()
+        """Fetch a contract by its UUID.
+
+        Served from the session's identity map when the contract was already
+        loaded in this unit of work (no SELECT); status updates mutate that same
+        instance, so the cached copy is never stale within the session.
+        """
+        return await self._session.get(EscrowContract, contract_id)
 
     async def get_by_status(self, status: EscrowStatus) -> list[EscrowContract]:
         """Fetch all contracts with a given status."""
@@ -74,11 +79,19 @@ class EscrowRepository:
         await self._session.flush()
         return contract
 
-    async def increment_retry(self, contract: EscrowContract) -> EscrowContract:
-        """Increment the retry counter on a contract."""
+    async def increment_retry(
+        self,
+        contract: EscrowContract,
+        flush: bool = True,
+    ) -> EscrowContract:
+        """Increment the retry counter on a contract.
+
+        Pass flush=False to defer the UPDATE to the caller's next flush.
+        """
         contract.retry_count += 1
         contract.updated_at = datetime.now(UTC)
-        await self._session.flush()
+        if flush:
+            await self._session.flush()
         return contract
 
 
@@ -95,14 +108,21 @@ class SubmissionRepository:
         return submission
 
     async def get_by_id(self, submission_id: uuid.UUID) -> WorkSubmission | None:
-        """Fetch a submission by its UUID."""
+        """Fetch a submission by its UUID (identity map first, then SELECT)."""
+        return await self._session.get(WorkSubmission, submission_id)
+
+    async def get_latest(self, contract_id: uuid.UUID) -> WorkSubmission | None:
+        """Fetch only the newest submission for a contract."""
         result = await self._session.execute(
-            select(WorkSubmission).where(WorkSubmission.id == submission_id)
+            select(WorkSubmission)
+            .where(WorkSubmission.contract_id == contract_id)
+            .order_by(WorkSubmission.submitted_at.desc())
+            .limit(1)
         )
         return result.scalar_one_or_none()
 
     async def get_by_contract(self, contract_id: uuid.UUID) -> list[WorkSubmission]:
-        """Fetch all submissions for a contract, newest first."""
+        """Fetch all submissions for a contract, newest first (audit views)."""
         result = await self._session.execute(
             select(WorkSubmission)
             .where(WorkSubmission.contract_id == contract_id)
@@ -115,19 +135,30 @@ class SubmissionRepository:
         submission: WorkSubmission,
         is_valid: bool,
         verification_result: dict,
+        flush: bool = True,
     ) -> WorkSubmission:
-        """Record the verification outcome on a submission."""
+        """Record the verification outcome on a submission.
+
+        Pass flush=False to defer the UPDATE to the caller's next flush.
+        """
         submission.is_valid = is_valid
         submission.verification_result = verification_result
-        await self._session.flush()
+        if flush:
+            await self._session.flush()
         return submission
 
 
 class EventRepository:
-    """Data access for the append-only audit event log."""
+    """Data access for the append-only audit event log.
 
-    def __init__(self, session: AsyncSession) -> None:
+    When the background event writer is running, record() defers the INSERT
+    until the caller's transaction commits and batches it off the request path.
+    Pass sync=True to always insert inline within the current transaction.
+    """
+
+    def __init__(self, session: AsyncSession, sync: bool = False) -> None:
         self._session = session
+        self._sync = sync
 
     async def record(
         self,
@@ -139,16 +170,21 @@ class EventRepository:
         metadata: dict | None = None,
     ) -> EscrowEvent:
         """Append a new audit event. This is the ONLY write operation allowed."""
-        evt = EscrowEvent(
-            contract_id=contract_id,
-            event_type=event_type.value,
-            old_status=old_status.value if old_status else None,
-            new_status=new_status.value,
-            actor=actor,
-            metadata_json=metadata,
-        )
-        self._session.add(evt)
-        await self._session.flush()
+        row = {
+            "id": uuid.uuid4(),
+            "contract_id": contract_id,
+            "event_type": event_type.value,
+            "old_status": old_status.value if old_status else None,
+            "new_status": new_status.value,
+            "actor": actor,
+            "metadata_json": metadata,
+            # Stamped now so batched rows keep transition order
+            "created_at": datetime.now(UTC),
+        }
+        evt = EscrowEvent(**row)
+        if self._sync or not enqueue_after_commit(self._session, row):
+            self._session.add(evt)
+            await self._session.flush()
         return evt
 
     async def get_by_contract(self, contract_id: uuid.UUID) -> list[EscrowEvent]:
@@ -159,3 +195,26 @@ class EventRepository:
             .order_by(EscrowEvent.created_at.asc())
         )
         return list(result.scalars().all())
+
+
+class Repositories:
+    """The repositories bound to one session."""
+
+    __slots__ = ("escrow", "submissions", "events")
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.escrow = EscrowRepository(session)
+        self.submissions = SubmissionRepository(session)
+        self.events = EventRepository(session)
+
+
+# session.info key for the cached Repositories bundle
+_REPOSITORIES_KEY = "repositories"
+
+
+def get_repositories(session: AsyncSession) -> Repositories:
+    """Return the repositories for `session`, building them on first use."""
+    repos = session.info.get(_REPOSITORIES_KEY)
+    if repos is None:
+        repos = session.info[_REPOSITORIES_KEY] = Repositories(session)
+    return repos
@@ -1,15 +1,21 @@
 """FastAPI application entry point for the Agentic Clearinghouse.
 
 Lifecycle:
-    1. Startup: Initialize logging, database, Redis, create tables (dev mode).
+    1. Startup: Initialize logging, database, audit event writer, Redis,
+       create tables (dev mode).
     2. Running: Serve REST API + MCP tools on a single Uvicorn process.
-    3. Shutdown: Close database and Redis connections gracefully.
+    3. Shutdown: Flush queued audit events, kill warm E2B sandboxes, close
+       the LLM judge HTTP client, database and Redis connections.
 
 The MCP server is mounted at /mcp so AI agents can discover tools
 alongside the REST API at /api/v1/*.
 
 Run with:
     uv run uvicorn agentic_clearinghouse.main:app --reload --host 0.0.0.0 --port 8000
+
+uvicorn[standard] serves on uvloop by default (--loop auto), so the async
+verifiers (E2B RPCs, LLM HTTPS calls) already run on a libuv-backed loop;
+no policy needs installing here.
 """
 
 from __future__ import annotations
@@ -48,6 +54,13 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     await init_db()
 
+    from agentic_clearinghouse.infrastructure.database.event_writer import (
+        start_event_writer,
+        stop_event_writer,
+    )
+
+    await start_event_writer()
+
     # 3. Initialize Redis
     from agentic_clearinghouse.infrastructure.redis_client import close_redis, init_redis
 
@@ -62,6 +75,13 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     # Shutdown
     logger.info("app.shutting_down")
+    await stop_event_writer()
+
+    from agentic_clearinghouse.verifiers.code_execution import close_sandbox_pools
+    from agentic_clearinghouse.verifiers.semantic import close_http_client
+
+    await close_sandbox_pools()
+    await close_http_client()
     await close_db()
     await close_redis()
     logger.info("app.stopped")
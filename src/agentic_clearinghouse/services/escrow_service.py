@@ -19,16 +19,12 @@ from agentic_clearinghouse.domain.exceptions import (
     InvalidStateTransitionError,
     WorkerAlreadyAssignedError,
 )
-from agentic_clearinghouse.domain.state_machine import EscrowStateMachine
+from agentic_clearinghouse.domain.state_machine import TRANSITION_TABLE, EscrowStateMachine
 from agentic_clearinghouse.infrastructure.database.orm_models import (
     EscrowContract,
     WorkSubmission,
 )
-from agentic_clearinghouse.infrastructure.database.repositories import (
-    EscrowRepository,
-    EventRepository,
-    SubmissionRepository,
-)
+from agentic_clearinghouse.infrastructure.database.repositories import get_repositories
 from agentic_clearinghouse.logging_config import get_logger
 
 if TYPE_CHECKING:
@@ -39,15 +35,19 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+# Status column value -> enum member, avoiding EscrowStatus(...) coercion per call
+_STATUS_FROM_VALUE: dict[str, EscrowStatus] = {s.value: s for s in EscrowStatus}
+
 
 class EscrowService:
     """Manages the escrow contract lifecycle."""
 
     def __init__(self, session: AsyncSession) -> None:
+        repos = get_repositories(session)
         self._session = session
-        self._escrow_repo = EscrowRepository(session)
-        self._submission_repo = SubmissionRepository(session)
-        self._event_repo = EventRepository(session)
+        self._escrow_repo = repos.escrow
+        self._submission_repo = repos.submissions
+        self._event_repo = repos.events
 
     # ------------------------------------------------------------------
     # Contract Creation
@@ -83,7 +83,7 @@ class EscrowService:
             metadata={"description": description},
         )
 
-        logger.info("escrow.created", contract_id=str(contract.id), amount=str(amount_usdc))
+        logger.info("escrow.created", contract_id=contract.id_str, amount=str(amount_usdc))
         return contract
 
     # ------------------------------------------------------------------
@@ -100,22 +100,22 @@ class EscrowService:
         contract = await self._get_contract_or_raise(contract_id)
 
         # Guard transition
-        self._fire_transition(contract, "on_chain_confirmed")
+        new_status = self._fire_transition(contract, "on_chain_confirmed")
 
         contract.funding_tx_hash = tx_hash
         contract.escrow_wallet_address = escrow_wallet_address
-        await self._escrow_repo.update_status(contract, EscrowStatus.FUNDED)
+        await self._escrow_repo.update_status(contract, new_status)
 
         await self._event_repo.record(
             contract_id=contract.id,
             event_type=EventType.CONTRACT_FUNDED,
             old_status=EscrowStatus.CREATED,
-            new_status=EscrowStatus.FUNDED,
+            new_status=new_status,
             actor="SYSTEM",
             metadata={"tx_hash": tx_hash, "escrow_wallet": escrow_wallet_address},
         )
 
-        logger.info("escrow.funded", contract_id=str(contract_id), tx_hash=tx_hash)
+        logger.info("escrow.funded", contract_id=contract.id_str, tx_hash=tx_hash)
         return contract
 
     # ------------------------------------------------------------------
@@ -131,22 +131,22 @@ class EscrowService:
         contract = await self._get_contract_or_raise(contract_id)
 
         if contract.worker_wallet is not None:
-            raise WorkerAlreadyAssignedError(str(contract_id))
+            raise WorkerAlreadyAssignedError(contract.id_str)
 
-        self._fire_transition(contract, "worker_accepts")
+        new_status = self._fire_transition(contract, "worker_accepts")
 
         contract.worker_wallet = worker_wallet
-        await self._escrow_repo.update_status(contract, EscrowStatus.IN_PROGRESS)
+        await self._escrow_repo.update_status(contract, new_status)
 
         await self._event_repo.record(
             contract_id=contract.id,
             event_type=EventType.WORKER_ASSIGNED,
             old_status=EscrowStatus.FUNDED,
-            new_status=EscrowStatus.IN_PROGRESS,
+            new_status=new_status,
             actor=worker_wallet,
         )
 
-        logger.info("escrow.worker_accepted", contract_id=str(contract_id), worker=worker_wallet)
+        logger.info("escrow.worker_accepted", contract_id=contract.id_str, worker=worker_wallet)
         return contract
 
     # ------------------------------------------------------------------
@@ -162,8 +162,8 @@ class EscrowService:
         """Submit work and transition to SUBMITTED."""
         contract = await self._get_contract_or_raise(contract_id)
 
-        self._fire_transition(contract, "worker_submits")
-        await self._escrow_repo.update_status(contract, EscrowStatus.SUBMITTED)
+        new_status = self._fire_transition(contract, "worker_submits")
+        await self._escrow_repo.update_status(contract, new_status)
 
         submission = WorkSubmission(
             contract_id=contract.id,
@@ -176,15 +176,15 @@ class EscrowService:
             contract_id=contract.id,
             event_type=EventType.WORK_SUBMITTED,
             old_status=EscrowStatus.IN_PROGRESS,
-            new_status=EscrowStatus.SUBMITTED,
+            new_status=new_status,
             actor=worker_wallet or contract.worker_wallet or "UNKNOWN",
-            metadata={"submission_id": str(submission.id)},
+            metadata={"submission_id": submission.id_str},
         )
 
         logger.info(
             "escrow.work_submitted",
-            contract_id=str(contract_id),
-            submission_id=str(submission.id),
+            contract_id=contract.id_str,
+            submission_id=submission.id_str,
         )
         return submission
 
@@ -195,14 +195,14 @@ class EscrowService:
     async def start_verification(self, contract_id: uuid.UUID) -> EscrowContract:
         """Transition from SUBMITTED to VERIFYING."""
         contract = await self._get_contract_or_raise(contract_id)
-        self._fire_transition(contract, "auto_verify")
-        await self._escrow_repo.update_status(contract, EscrowStatus.VERIFYING)
+        new_status = self._fire_transition(contract, "auto_verify")
+        await self._escrow_repo.update_status(contract, new_status)
 
         await self._event_repo.record(
             contract_id=contract.id,
             event_type=EventType.VERIFICATION_STARTED,
             old_status=EscrowStatus.SUBMITTED,
-            new_status=EscrowStatus.VERIFYING,
+            new_status=new_status,
             actor="SYSTEM",
         )
         return contract
@@ -215,26 +215,27 @@ class EscrowService:
     ) -> EscrowContract:
         """Record successful verification and transition to COMPLETED."""
         contract = await self._get_contract_or_raise(contract_id)
-        self._fire_transition(contract, "verification_passed")
-        await self._escrow_repo.update_status(contract, EscrowStatus.COMPLETED)
+        new_status = self._fire_transition(contract, "verification_passed")
 
-        # Update the submission record
+        # Update the submission record (flushed together with the status change)
         submission = await self._submission_repo.get_by_id(submission_id)
         if submission:
             await self._submission_repo.update_verification(
-                submission, is_valid=True, verification_result=verification_result
+                submission, is_valid=True, verification_result=verification_result, flush=False
             )
 
+        await self._escrow_repo.update_status(contract, new_status)
+
         await self._event_repo.record(
             contract_id=contract.id,
             event_type=EventType.VERIFICATION_PASSED,
             old_status=EscrowStatus.VERIFYING,
-            new_status=EscrowStatus.COMPLETED,
+            new_status=new_status,
             actor="SYSTEM",
             metadata=verification_result,
         )
 
-        logger.info("escrow.verification_passed", contract_id=str(contract_id))
+        logger.info("escrow.verification_passed", contract_id=contract.id_str)
         return contract
 
     async def record_verification_failed(
@@ -246,45 +247,47 @@ class EscrowService:
         """Record failed verification — retry or fail permanently."""
         contract = await self._get_contract_or_raise(contract_id)
 
-        # Update the submission record
+        # Update the submission record and retry counter. Both are independent
+        # writes, so they are flushed in one round trip with the status change below
+        # (an AsyncSession cannot run concurrent statements, so no gather here).
         submission = await self._submission_repo.get_by_id(submission_id)
         if submission:
             await self._submission_repo.update_verification(
-                submission, is_valid=False, verification_result=verification_result
+                submission, is_valid=False, verification_result=verification_result, flush=False
             )
 
-        await self._escrow_repo.increment_retry(contract)
+        await self._escrow_repo.increment_retry(contract, flush=False)
 
         if contract.retry_count >= contract.max_retries:
             # Max retries exceeded — FAIL
-            self._fire_transition(contract, "max_retries_exceeded")
-            await self._escrow_repo.update_status(contract, EscrowStatus.FAILED)
+            new_status = self._fire_transition(contract, "max_retries_exceeded")
+            await self._escrow_repo.update_status(contract, new_status)
 
             await self._event_repo.record(
                 contract_id=contract.id,
                 event_type=EventType.MAX_RETRIES_EXCEEDED,
                 old_status=EscrowStatus.VERIFYING,
-                new_status=EscrowStatus.FAILED,
+                new_status=new_status,
                 actor="SYSTEM",
                 metadata={"retry_count": contract.retry_count, **verification_result},
             )
-            logger.info("escrow.max_retries_exceeded", contract_id=str(contract_id))
+            logger.info("escrow.max_retries_exceeded", contract_id=contract.id_str)
         else:
             # Retry — back to IN_PROGRESS
-            self._fire_transition(contract, "verification_failed_retry")
-            await self._escrow_repo.update_status(contract, EscrowStatus.IN_PROGRESS)
+            new_status = self._fire_transition(contract, "verification_failed_retry")
+            await self._escrow_repo.update_status(contract, new_status)
 
             await self._event_repo.record(
                 contract_id=contract.id,
                 event_type=EventType.VERIFICATION_FAILED,
                 old_status=EscrowStatus.VERIFYING,
-                new_status=EscrowStatus.IN_PROGRESS,
+                new_status=new_status,
                 actor="SYSTEM",
                 metadata={"retry_count": contract.retry_count, **verification_result},
             )
             logger.info(
                 "escrow.verification_failed_retry",
-                contract_id=str(contract_id),
+                contract_id=contract.id_str,
                 retry=contract.retry_count,
             )
 
@@ -302,21 +305,21 @@ class EscrowService:
     ) -> EscrowContract:
         """Raise a dispute on a contract."""
         contract = await self._get_contract_or_raise(contract_id)
-        old_status = EscrowStatus(contract.status)
+        old_status = _STATUS_FROM_VALUE[contract.status]
 
-        self._fire_transition(contract, "buyer_disputes")
-        await self._escrow_repo.update_status(contract, EscrowStatus.DISPUTED)
+        new_status = self._fire_transition(contract, "buyer_disputes")
+        await self._escrow_repo.update_status(contract, new_status)
 
         await self._event_repo.record(
             contract_id=contract.id,
             event_type=EventType.DISPUTE_RAISED,
             old_status=old_status,
-            new_status=EscrowStatus.DISPUTED,
+            new_status=new_status,
             actor=raised_by,
             metadata={"reason": reason},
         )
 
-        logger.info("escrow.dispute_raised", contract_id=str(contract_id), by=raised_by)
+        logger.info("escrow.dispute_raised", contract_id=contract.id_str, by=raised_by)
         return contract
 
     # ------------------------------------------------------------------
@@ -332,7 +335,7 @@ class EscrowService:
         contract = await self._get_contract_or_raise(contract_id)
         sm = EscrowStateMachine(current_status=contract.status)
         return {
-            "contract_id": str(contract.id),
+            "contract_id": contract.id_str,
             "status": contract.status,
             "retry_count": contract.retry_count,
             "max_retries": contract.max_retries,
@@ -353,18 +356,13 @@ class EscrowService:
             raise ContractNotFoundError(str(contract_id))
         return contract
 
-    def _fire_transition(self, contract: EscrowContract, event_name: str) -> None:
-        """Validate and fire a state machine transition.
+    def _fire_transition(self, contract: EscrowContract, event_name: str) -> EscrowStatus:
+        """Validate a state machine transition and return the resulting status.
 
-        Raises InvalidStateTransitionError if the transition is illegal.
+        A single lookup in the precomputed transition table; no state machine
+        is constructed. Raises InvalidStateTransitionError if the transition is illegal.
         """
-        from statemachine.exceptions import TransitionNotAllowed
-
-        sm = EscrowStateMachine(current_status=contract.status)
-        event_method = getattr(sm, event_name, None)
-        if event_method is None:
+        new_status = TRANSITION_TABLE.get((contract.status, event_name))
+        if new_status is None:
             raise InvalidStateTransitionError(contract.status, event_name)
-        try:
-            event_method()
-        except TransitionNotAllowed as err:
-            raise InvalidStateTransitionError(contract.status, event_name) from err
+        return new_status
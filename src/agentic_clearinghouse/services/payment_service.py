@@ -9,7 +9,8 @@ In production mode, uses CdpEvmWalletProvider for Base Sepolia USDC transfers.
 
 from __future__ import annotations
 
-import uuid
+import os
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from agentic_clearinghouse.config import get_settings
@@ -18,8 +19,48 @@ from agentic_clearinghouse.logging_config import get_logger
 if TYPE_CHECKING:
     from decimal import Decimal
 
+    from coinbase_agentkit import CdpEvmWalletProvider, ERC20ActionProvider
+
 logger = get_logger(__name__)
 
+# USDC on Base Sepolia
+USDC_CONTRACT_ADDRESS = "0x036CbD53842c5426634e7929541eC2318f3dCF7e"
+
+# Upper bound on cached escrow wallet providers (one per escrow wallet address)
+WALLET_PROVIDER_CACHE_SIZE = 256
+
+
+def _new_wallet_provider(address: str | None = None) -> CdpEvmWalletProvider:
+    """Construct a CDP wallet provider, optionally bound to an existing address."""
+    from coinbase_agentkit import CdpEvmWalletProvider, CdpEvmWalletProviderConfig
+
+    settings = get_settings()
+    return CdpEvmWalletProvider(CdpEvmWalletProviderConfig(
+        api_key_id=settings.cdp_api_key_id,
+        api_key_secret=settings.cdp_api_key_secret,
+        wallet_secret=settings.cdp_wallet_secret,
+        network_id=settings.cdp_network_id,
+        address=address,
+    ))
+
+
+@lru_cache(maxsize=WALLET_PROVIDER_CACHE_SIZE)
+def _get_wallet_provider(address: str) -> CdpEvmWalletProvider:
+    """Return a warm wallet provider for an escrow wallet (bounded LRU).
+
+    Constructing a provider opens a new HTTPS session to the CDP API and
+    derives keys, so providers are reused across settlements.
+    """
+    return _new_wallet_provider(address)
+
+
+@lru_cache(maxsize=1)
+def _get_erc20_action_provider() -> ERC20ActionProvider:
+    """Return the shared (stateless) ERC-20 action provider."""
+    from coinbase_agentkit import erc20_action_provider
+
+    return erc20_action_provider()
+
 
 class PaymentService:
     """Handles escrow funding and settlement payments."""
@@ -40,21 +81,14 @@ class PaymentService:
         In production, creates a new CDP wallet.
         """
         if self._simulate:
-            fake_addr = "0x" + uuid.uuid4().hex[:40]
+            fake_addr = "0x" + os.urandom(20).hex()
             logger.info("payment.escrow_wallet_created", address=fake_addr, simulated=True)
             return fake_addr
 
         # Real implementation with AgentKit
-        settings = get_settings()
         try:
-            from coinbase_agentkit import CdpEvmWalletProvider, CdpEvmWalletProviderConfig
-
-            wallet_provider = CdpEvmWalletProvider(CdpEvmWalletProviderConfig(
-                api_key_id=settings.cdp_api_key_id,
-                api_key_secret=settings.cdp_api_key_secret,
-                wallet_secret=settings.cdp_wallet_secret,
-                network_id=settings.cdp_network_id,
-            ))
+            # Always a fresh provider here: omitting the address creates a new wallet
+            wallet_provider = _new_wallet_provider()
             address = wallet_provider.get_address()
             logger.info("payment.escrow_wallet_created", address=address, simulated=False)
             return address
@@ -73,7 +107,7 @@ class PaymentService:
         Returns a fake or real transaction hash.
         """
         if self._simulate:
-            tx_hash = "0x" + uuid.uuid4().hex + uuid.uuid4().hex[:2]
+            tx_hash = "0x" + os.urandom(32).hex()
             logger.info(
                 "payment.funding_simulated",
                 tx_hash=tx_hash,
@@ -97,7 +131,7 @@ class PaymentService:
         Returns the settlement transaction hash.
         """
         if self._simulate:
-            tx_hash = "0x" + uuid.uuid4().hex + uuid.uuid4().hex[:2]
+            tx_hash = "0x" + os.urandom(32).hex()
             logger.info(
                 "payment.settlement_simulated",
                 tx_hash=tx_hash,
@@ -108,41 +142,16 @@ class PaymentService:
             return tx_hash
 
         # Real implementation with AgentKit ERC-20 transfer
-        settings = get_settings()
         try:
-            from coinbase_agentkit import (
-                AgentKit,
-                AgentKitConfig,
-                CdpEvmWalletProvider,
-                CdpEvmWalletProviderConfig,
-                erc20_action_provider,
-                wallet_action_provider,
-            )
-
-            wallet_provider = CdpEvmWalletProvider(CdpEvmWalletProviderConfig(
-                api_key_id=settings.cdp_api_key_id,
-                api_key_secret=settings.cdp_api_key_secret,
-                wallet_secret=settings.cdp_wallet_secret,
-                network_id=settings.cdp_network_id,
-                address=escrow_wallet,
-            ))
-
-            AgentKit(AgentKitConfig(
-                wallet_provider=wallet_provider,
-                action_providers=[
-                    erc20_action_provider(),
-                    wallet_action_provider(),
-                ],
-            ))
+            wallet_provider = _get_wallet_provider(escrow_wallet)
 
             # Execute ERC-20 USDC transfer
-            # USDC on Base Sepolia: 0x036CbD53842c5426634e7929541eC2318f3dCF7e
-            result = erc20_action_provider().transfer(
+            result = _get_erc20_action_provider().transfer(
                 wallet_provider,
                 {
                     "to": worker_wallet,
                     "amount": str(amount_usdc),
-                    "contract_address": "0x036CbD53842c5426634e7929541eC2318f3dCF7e",
+                    "contract_address": USDC_CONTRACT_ADDRESS,
                 },
             )
 
@@ -6,10 +6,12 @@ Four strategies:
     - CodeExecutionVerifier:  Sandboxed execution via E2B
     - MockVerifier:           Instant configurable pass/fail for dry-run testing
 
-The VerifierFactory creates the correct verifier based on the
+The VerifierFactory returns the correct verifier based on the
 verification_logic["type"] field in the contract.
 """
 
+from types import MappingProxyType
+
 from agentic_clearinghouse.domain.enums import VerifierType
 from agentic_clearinghouse.domain.verifier_protocol import (
     VerificationRequest,
@@ -29,14 +31,41 @@ class MockVerifier:
         - should_pass (bool): Whether verification passes. Default True.
         - score (float): Score to return. Default 1.0 if pass, 0.0 if fail.
         - details (str): Custom details message. Optional.
+
+    Configs that only set "type"/"should_pass" get a shared, prebuilt result
+    whose logs are a read-only view (to_dict() hands out a copy).
     """
 
+    _DEFAULT_KEYS = frozenset({"type", "should_pass"})
+    _DEFAULT_RESULTS = {
+        True: VerificationResult(
+            is_valid=True,
+            score=1.0,
+            details="Mock verification passed (dry-run mode)",
+            logs=MappingProxyType({"mode": "dry-run", "verifier": "mock"}),
+        ),
+        False: VerificationResult(
+            is_valid=False,
+            score=0.0,
+            details="Mock verification failed (dry-run mode)",
+            logs=MappingProxyType({"mode": "dry-run", "verifier": "mock"}),
+        ),
+    }
+
     async def verify(self, request: VerificationRequest) -> VerificationResult:
-        should_pass = request.verification_config.get("should_pass", True)
-        score = request.verification_config.get(
-            "score", 1.0 if should_pass else 0.0
-        )
-        details = request.verification_config.get(
+        return self.verify_sync(request)
+
+    def verify_sync(self, request: VerificationRequest) -> VerificationResult:
+        """Synchronous verify — callers that know the verifier is a mock skip the await."""
+        v_config = request.verification_config
+        should_pass = v_config.get("should_pass", True)
+
+        # Exact bool only: should_pass comes from buyer JSON and may be unhashable (or 1/0)
+        if v_config.keys() <= self._DEFAULT_KEYS and type(should_pass) is bool:
+            return self._DEFAULT_RESULTS[should_pass]
+
+        score = v_config.get("score", 1.0 if should_pass else 0.0)
+        details = v_config.get(
             "details",
             "Mock verification passed (dry-run mode)"
             if should_pass
@@ -50,8 +79,27 @@ class MockVerifier:
         )
 
 
+# One shared instance of each verifier per process. Their result/verdict caches and
+# settings-derived config (resolved on first use) are therefore process-wide too.
+_CODE_EXECUTION_VERIFIER = CodeExecutionVerifier()
+_SEMANTIC_VERIFIER = SemanticVerifier()
+_SCHEMA_VERIFIER = SchemaVerifier()
+_MOCK_VERIFIER = MockVerifier()
+
+_SUPPORTED_TYPES = (
+    VerifierType.CODE_EXECUTION.value,
+    VerifierType.SEMANTIC.value,
+    VerifierType.SCHEMA.value,
+    "mock",
+)
+_MISSING_TYPE_MSG = (
+    f"verification_logic must contain a 'type' key. Valid types: {list(_SUPPORTED_TYPES)}"
+)
+_UNKNOWN_TYPE_MSG = "Unknown verifier type: '%s'. " + f"Valid types: {list(_SUPPORTED_TYPES)}"
+
+
 class VerifierFactory:
-    """Factory that creates the correct verifier based on verification_logic type.
+    """Factory that returns the correct verifier based on verification_logic type.
 
     Usage:
         verifier = VerifierFactory.create({"type": "code_execution", "timeout": 30})
@@ -62,47 +110,40 @@ class VerifierFactory:
         result = await verifier.verify(request)
     """
 
-    _registry: dict[str, type] = {
-        VerifierType.CODE_EXECUTION.value: CodeExecutionVerifier,
-        VerifierType.SEMANTIC.value: SemanticVerifier,
-        VerifierType.SCHEMA.value: SchemaVerifier,
-        "mock": MockVerifier,
-    }
-
     @classmethod
     def create(cls, verification_logic: dict) -> VerifierStrategy:
-        """Create a verifier instance from the verification_logic config.
+        """Return the verifier for the verification_logic config.
 
         Args:
             verification_logic: Dict with at least a "type" key.
                 Example: {"type": "code_execution", "timeout": 30}
 
         Returns:
-            A verifier instance that satisfies the VerifierStrategy protocol.
+            A shared verifier instance that satisfies the VerifierStrategy protocol.
 
         Raises:
             ValueError: If the type is unknown or missing.
         """
         v_type = verification_logic.get("type")
         if not v_type:
-            raise ValueError(
-                "verification_logic must contain a 'type' key. "
-                f"Valid types: {list(cls._registry.keys())}"
-            )
-
-        verifier_class = cls._registry.get(v_type)
-        if verifier_class is None:
-            raise ValueError(
-                f"Unknown verifier type: '{v_type}'. "
-                f"Valid types: {list(cls._registry.keys())}"
-            )
-
-        return verifier_class()
+            raise ValueError(_MISSING_TYPE_MSG)
+
+        match v_type:
+            case VerifierType.CODE_EXECUTION.value:
+                return _CODE_EXECUTION_VERIFIER
+            case VerifierType.SEMANTIC.value:
+                return _SEMANTIC_VERIFIER
+            case VerifierType.SCHEMA.value:
+                return _SCHEMA_VERIFIER
+            case "mock":
+                return _MOCK_VERIFIER
+            case _:
+                raise ValueError(_UNKNOWN_TYPE_MSG % v_type)
 
     @classmethod
     def get_supported_types(cls) -> list[str]:
         """Return the list of supported verifier type strings."""
-        return list(cls._registry.keys())
+        return list(_SUPPORTED_TYPES)
 
 
 __all__ = [
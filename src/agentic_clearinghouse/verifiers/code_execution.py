@@ -5,13 +5,22 @@ Use case: "Write a Python script that calculates the 10th Fibonacci number"
 that it produces the expected output.
 
 Verification flow:
-    1. Spin up an E2B sandbox (isolated cloud VM, ~400ms cold start).
-    2. Run the submitted Python code.
-    3. Check: Did it exit with code 0? Does stdout contain expected_output?
+    1. Take a pre-created sandbox from the warm pool (opt-in via
+       e2b_pool_min_warm), or spin up a new one (isolated cloud VM, ~400ms
+       cold start). Contracts that need heavy dependencies name a prebuilt
+       E2B template (a snapshot with packages already installed) so the
+       install cost is never paid per run.
+    2. Run any buyer-defined setup_commands (one round-trip), then the
+       submitted Python code.
+    3. Check: Did it exit with code 0? Were the expected files created (all
+       probed concurrently on the same sandbox)? Does stdout contain
+       expected_output?
     4. Return pass/fail with full stdout/stderr logs.
 
 Security:
     - E2B sandboxes are fully isolated (separate VM per execution).
+    - The warm pool only pre-creates sandboxes; none is ever reused after
+      running a submission.
     - Network access, filesystem, and system calls are sandboxed.
     - Timeout enforced both at E2B level and our application level.
     - Malicious code (rm -rf /, network exfil) fails safely.
@@ -19,7 +28,13 @@ Security:
 
 from __future__ import annotations
 
-from tenacity import retry, stop_after_attempt, wait_exponential
+import asyncio
+import hashlib
+import io
+import shlex
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
 
 from agentic_clearinghouse.config import get_settings
 from agentic_clearinghouse.domain.verifier_protocol import (
@@ -28,8 +43,252 @@ from agentic_clearinghouse.domain.verifier_protocol import (
 )
 from agentic_clearinghouse.logging_config import get_logger
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Coroutine, Sequence
+
+    from e2b_code_interpreter import AsyncSandbox
+
 logger = get_logger(__name__)
 
+# Max results kept per verifier for verification_config["cache"] = True
+RESULT_CACHE_SIZE = 1024
+
+# Sandbox runs: one retry after 2s (exponential backoff from 2s, capped)
+SANDBOX_ATTEMPTS = 2
+SANDBOX_MAX_BACKOFF_SECONDS = 8
+
+# Most (api_key, template) warm pools kept at once; past this, sandboxes boot on demand
+MAX_SANDBOX_POOLS = 8
+
+
+# --- Warm Sandbox Pool ---
+
+
+class _SandboxPool:
+    """Warm pool of pre-created, single-use E2B sandboxes for one API key and template.
+
+    Sandboxes are created off the critical path so verify() skips the cold
+    start, but each one still runs exactly one submission and is killed
+    afterwards. Resetting and reusing a sandbox that ran untrusted code would
+    let one worker's submission tamper with the environment that judges the
+    next one.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        template: str | None,
+        min_warm: int,
+        lifetime: int,
+    ) -> None:
+        self._api_key = api_key
+        self._template = template
+        self._min_warm = min_warm
+        self._lifetime = lifetime
+        self._idle: asyncio.Queue[tuple[float, AsyncSandbox]] = asyncio.Queue()
+        self._pending = 0
+        self._tasks: set[asyncio.Task[None]] = set()
+        self.loop = asyncio.get_running_loop()
+
+    async def acquire(self, timeout: int) -> AsyncSandbox:
+        """Return a fresh sandbox with at least `timeout` seconds of lifetime left."""
+        deadline = time.monotonic() + timeout
+        try:
+            while not self._idle.empty():
+                expires_at, sandbox = self._idle.get_nowait()
+                if expires_at > deadline:
+                    return sandbox
+                # Too close to E2B's own lifetime limit to finish this run
+                self._spawn(self._discard(sandbox))
+        finally:
+            self._replenish()
+
+        from e2b_code_interpreter import AsyncSandbox
+
+        return await AsyncSandbox.create(
+            template=self._template, api_key=self._api_key, timeout=timeout
+        )
+
+    async def fill(self, count: int) -> None:
+        """Start warm-ups until `count` sandboxes are idle or in flight, and wait for them."""
+        self._replenish(count)
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def close(self) -> None:
+        """Cancel in-flight warm-ups and kill every idle sandbox."""
+        if not self.loop.is_closed():
+            for task in list(self._tasks):
+                task.cancel()
+        while not self._idle.empty():
+            _, sandbox = self._idle.get_nowait()
+            await self._discard(sandbox)
+
+    def _replenish(self, target: int | None = None) -> None:
+        """Start warm-ups until idle + in-flight sandboxes reach `target` (default min_warm)."""
+        if target is None:
+            target = self._min_warm
+        while self._idle.qsize() + self._pending < target:
+            self._pending += 1
+            self._spawn(self._warm_one())
+
+    async def _warm_one(self) -> None:
+        from e2b_code_interpreter import AsyncSandbox
+
+        try:
+            sandbox = await AsyncSandbox.create(
+                template=self._template, api_key=self._api_key, timeout=self._lifetime
+            )
+        except Exception as exc:
+            logger.warning("verifier.code_execution.pool_warm_failed", error=str(exc))
+            return
+        finally:
+            self._pending -= 1
+        self._idle.put_nowait((time.monotonic() + self._lifetime, sandbox))
+
+    @staticmethod
+    async def _discard(sandbox: AsyncSandbox) -> None:
+        try:
+            await sandbox.kill()
+        except Exception as exc:
+            logger.warning("verifier.code_execution.pool_kill_failed", error=str(exc))
+
+    def _spawn(self, coro: Coroutine[Any, Any, None]) -> None:
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+
+# Module-level pools keyed by (api_key, template), built lazily on first verification
+_POOLS: dict[tuple[str, str | None], _SandboxPool] = {}
+
+
+async def _get_pool(api_key: str, template: str | None) -> _SandboxPool | None:
+    """Return the warm pool for `api_key` + `template`, or None to boot sandboxes on demand.
+
+    Only the default template and those listed in e2b_pool_templates are
+    pooled. Templates are named by buyer-defined contracts, so warming every
+    one seen would keep billed sandboxes idling for templates never used again.
+    """
+    settings = get_settings()
+    if settings.e2b_pool_min_warm <= 0:
+        return None
+    if template is not None and template not in settings.e2b_pool_template_list:
+        return None
+    key = (api_key, template)
+    pool = _POOLS.get(key)
+    if pool is not None and pool.loop is asyncio.get_running_loop():
+        return pool
+    if pool is not None:
+        # Built on an event loop that has since been replaced; kill its sandboxes first
+        del _POOLS[key]
+        await pool.close()
+    elif len(_POOLS) >= MAX_SANDBOX_POOLS:
+        return None
+    return _POOLS.setdefault(
+        key,
+        _SandboxPool(
+            api_key,
+            template,
+            min_warm=settings.e2b_pool_min_warm,
+            lifetime=settings.e2b_pool_sandbox_lifetime_seconds,
+        ),
+    )
+
+
+async def warm_sandbox_pool(
+    api_key: str,
+    template: str | None = None,
+    count: int | None = None,
+) -> None:
+    """Pre-create sandboxes for `api_key` + `template` before the first verification.
+
+    Waits until `count` sandboxes (default e2b_pool_min_warm) are idle, so a
+    burst of verifications right afterwards skips the cold start entirely.
+    Warm-up failures are logged and the pool falls back to cold creation.
+    Templates that are not pooled (see _get_pool) are left alone.
+    """
+    pool = await _get_pool(api_key, template)
+    if pool is None:
+        return
+    await pool.fill(count if count is not None else get_settings().e2b_pool_min_warm)
+
+
+async def close_sandbox_pools() -> None:
+    """Kill all idle pooled sandboxes. Called during app shutdown."""
+    pools = list(_POOLS.values())
+    _POOLS.clear()
+    for pool in pools:
+        await pool.close()
+
+
+async def _prepare_sandbox(
+    sandbox: AsyncSandbox,
+    setup_commands: Sequence[str],
+    timeout: int,
+) -> None:
+    """Run all setup commands as one shell script in a single E2B round-trip.
+
+    Each SDK call costs a network round-trip, so steps like mkdir / pip
+    install / chmod are folded into one `commands.run` rather than issued
+    one by one. The script stops at the first failing command.
+    """
+    if not setup_commands:
+        return
+    script = "\n".join(["set -e", *setup_commands])
+    await sandbox.commands.run(f"bash -c {shlex.quote(script)}", timeout=timeout)
+
+
+def _line_writer(buf: io.StringIO) -> Callable[[Any], None]:
+    """Build an E2B output callback that appends newline-separated lines to `buf`."""
+
+    first = True
+
+    def write(msg: Any) -> None:
+        nonlocal first
+        if not first:
+            buf.write("\n")
+        first = False
+        buf.write(msg.line)
+
+    return write
+
+
+def _result_cache_key(
+    payload: str,
+    v_config: dict,
+    timeout: int,
+    expected_output: str,
+) -> str:
+    """Content key for a cached result: everything that can change the outcome."""
+    digest = hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+    template = v_config.get("template") or ""
+    setup = "\n".join(_setup_commands(v_config))
+    files = "\n".join(_expected_files(v_config))
+    return "\x1f".join((digest, expected_output, str(timeout), template, setup, files))
+
+
+def _setup_commands(v_config: dict) -> list[str]:
+    """Normalize verification_config["setup_commands"] (a command or list of commands)."""
+    commands = v_config.get("setup_commands") or []
+    return [commands] if isinstance(commands, str) else list(commands)
+
+
+def _expected_files(v_config: dict) -> list[str]:
+    """Normalize verification_config["expected_file"] (a path or list of paths)."""
+    expected = v_config.get("expected_file") or []
+    return [expected] if isinstance(expected, str) else list(expected)
+
+
+async def _missing_files(sandbox: AsyncSandbox, paths: Sequence[str]) -> list[str]:
+    """Return the paths that do not exist, checking them all concurrently."""
+    if not paths:
+        return []
+    found = await asyncio.gather(*(sandbox.files.exists(path) for path in paths))
+    return [path for path, exists in zip(paths, found, strict=True) if not exists]
+
+
+# --- Verifier ---
+
 
 class CodeExecutionVerifier:
     """Verifier that runs code in an E2B sandbox and checks output."""
@@ -38,14 +297,20 @@ class CodeExecutionVerifier:
         """Initialize with optional overrides (defaults come from config)."""
         self._api_key = api_key
         self._timeout = timeout
+        self._config: dict | None = None
+        self._result_cache: OrderedDict[str, VerificationResult] = OrderedDict()
 
     def _get_config(self) -> dict:
-        """Resolve configuration from overrides or settings."""
-        settings = get_settings()
-        return {
-            "api_key": self._api_key if self._api_key is not None else settings.e2b_api_key,
-            "timeout": self._timeout if self._timeout is not None else settings.e2b_timeout_seconds,
-        }
+        """Resolve configuration from overrides or settings (once per instance)."""
+        if self._config is None:
+            settings = get_settings()
+            self._config = {
+                "api_key": self._api_key if self._api_key is not None else settings.e2b_api_key,
+                "timeout": (
+                    self._timeout if self._timeout is not None else settings.e2b_timeout_seconds
+                ),
+            }
+        return self._config
 
     async def verify(self, request: VerificationRequest) -> VerificationResult:
         """Run the submitted code in an E2B sandbox and verify output.
@@ -56,7 +321,14 @@ class CodeExecutionVerifier:
                 - verification_config: Optional keys:
                     - "timeout" (int): Override timeout in seconds.
                     - "expected_output" (str): Expected stdout content.
-                    - "expected_file" (str): Expected file to be created.
+                    - "expected_file" (str | list[str]): File(s) the code must create.
+                    - "template" (str): E2B template to boot, e.g. one with the
+                      contract's dependencies preinstalled.
+                    - "setup_commands" (str | list[str]): Shell command(s) run before
+                      the code, batched into a single sandbox call.
+                    - "cache" (bool): Reuse the result of an identical earlier
+                      run instead of executing again. Only safe for
+                      deterministic code, so it is off by default.
 
         Returns:
             VerificationResult with execution logs and pass/fail status.
@@ -64,7 +336,12 @@ class CodeExecutionVerifier:
         config = self._get_config()
         v_config = request.verification_config
         timeout = v_config.get("timeout", config["timeout"])
-        expected_output = v_config.get("expected_output", "").strip()
+        template = v_config.get("template")
+        setup_commands = _setup_commands(v_config)
+        expected_files = _expected_files(v_config)
+        expected_output = v_config.get("expected_output") or ""
+        if expected_output:
+            expected_output = expected_output.strip()
 
         if not config["api_key"]:
             return VerificationResult(
@@ -73,18 +350,52 @@ class CodeExecutionVerifier:
                 error="MISSING_E2B_API_KEY",
             )
 
+        run_args = (config["api_key"], timeout, template, setup_commands, expected_files)
+        if not v_config.get("cache"):
+            return await self._execute(request, *run_args, expected_output)
+
+        key = _result_cache_key(request.payload, v_config, timeout, expected_output)
+        cached = self._result_cache.get(key)
+        if cached is not None:
+            self._result_cache.move_to_end(key)
+            logger.info("verifier.code_execution.cache_hit", contract_id=request.contract_id)
+            return cached
+
+        result = await self._execute(request, *run_args, expected_output)
+        # Verifier failures (timeouts, sandbox errors) are transient — never cache them
+        if result.error is None:
+            self._result_cache[key] = result
+            if len(self._result_cache) > RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+        return result
+
+    async def _execute(
+        self,
+        request: VerificationRequest,
+        api_key: str,
+        timeout: int,
+        template: str | None,
+        setup_commands: Sequence[str],
+        expected_files: Sequence[str],
+        expected_output: str,
+    ) -> VerificationResult:
+        """Run the code in a sandbox and check exit code, files, and output."""
         logger.info(
             "verifier.code_execution.start",
             contract_id=request.contract_id,
             timeout=timeout,
+            template=template,
             has_expected_output=bool(expected_output),
         )
 
         try:
-            stdout, stderr, exit_code = await self._run_in_sandbox(
+            stdout, stderr, exit_code, missing_files = await self._run_in_sandbox(
                 code=request.payload,
-                api_key=config["api_key"],
+                api_key=api_key,
                 timeout=timeout,
+                template=template,
+                setup_commands=setup_commands,
+                expected_files=expected_files,
             )
 
             logs = {
@@ -94,6 +405,9 @@ class CodeExecutionVerifier:
                 "timeout": timeout,
                 "expected_output": expected_output,
             }
+            if expected_files:
+                logs["expected_files"] = list(expected_files)
+                logs["missing_files"] = missing_files
 
             # --- Check 1: Exit code must be 0 ---
             if exit_code != 0:
@@ -108,10 +422,27 @@ class CodeExecutionVerifier:
                     logs=logs,
                 )
 
-            # --- Check 2: Expected output (if specified) ---
+            # --- Check 2: Expected files (if specified) ---
+            if missing_files:
+                logger.info(
+                    "verifier.code_execution.missing_files",
+                    contract_id=request.contract_id,
+                    missing=missing_files,
+                )
+                return VerificationResult(
+                    is_valid=False,
+                    details=f"Code ran successfully but did not create: {', '.join(missing_files)}",
+                    logs=logs,
+                )
+
+            # --- Check 3: Expected output (if specified) ---
             if expected_output:
                 stdout_stripped = stdout.strip()
-                if expected_output in stdout_stripped:
+                # Most contracts print the answer last: check the tail before scanning
+                if (
+                    stdout_stripped.endswith(expected_output)
+                    or expected_output in stdout_stripped
+                ):
                     logger.info(
                         "verifier.code_execution.passed",
                         contract_id=request.contract_id,
@@ -178,43 +509,74 @@ class CodeExecutionVerifier:
                 logs={"exception": str(exc)},
             )
 
-    @retry(
-        stop=stop_after_attempt(2),
-        wait=wait_exponential(multiplier=1, min=2, max=8),
-        reraise=True,
-    )
     async def _run_in_sandbox(
         self,
         code: str,
         api_key: str,
         timeout: int,
-    ) -> tuple[str, str, int]:
-        """Execute code in an E2B sandbox and return (stdout, stderr, exit_code).
+        template: str | None = None,
+        setup_commands: Sequence[str] = (),
+        expected_files: Sequence[str] = (),
+    ) -> tuple[str, str, int, list[str]]:
+        """Execute code in an E2B sandbox, retrying with exponential backoff.
 
-        Uses the E2B Code Interpreter SDK. The sandbox is automatically
-        destroyed when the context manager exits.
+        Returns:
+            (stdout, stderr, exit_code, missing_files)
         """
-        from e2b_code_interpreter import AsyncSandbox
+        attempt = 1
+        while True:
+            try:
+                return await self._run_in_sandbox_once(
+                    code, api_key, timeout, template, setup_commands, expected_files
+                )
+            except Exception:
+                if attempt >= SANDBOX_ATTEMPTS:
+                    raise
+                await asyncio.sleep(min(SANDBOX_MAX_BACKOFF_SECONDS, 2 ** max(1, attempt - 1)))
+                attempt += 1
+
+    async def _run_in_sandbox_once(
+        self,
+        code: str,
+        api_key: str,
+        timeout: int,
+        template: str | None,
+        setup_commands: Sequence[str],
+        expected_files: Sequence[str],
+    ) -> tuple[str, str, int, list[str]]:
+        """Execute code in one E2B sandbox (a single attempt).
+
+        Uses the E2B Code Interpreter SDK. The sandbox comes from the warm
+        pool when one is enabled and is always killed afterwards. File checks
+        run on the same sandbox before it is killed.
+        """
+        stdout_buf = io.StringIO()
+        stderr_buf = io.StringIO()
 
-        stdout_parts: list[str] = []
-        stderr_parts: list[str] = []
+        pool = await _get_pool(api_key, template)
+        if pool is not None:
+            sandbox = await pool.acquire(timeout)
+        else:
+            from e2b_code_interpreter import AsyncSandbox
 
-        sandbox = await AsyncSandbox.create(api_key=api_key, timeout=timeout)
+            sandbox = await AsyncSandbox.create(template=template, api_key=api_key, timeout=timeout)
         try:
+            await _prepare_sandbox(sandbox, setup_commands, timeout)
             execution = await sandbox.run_code(
                 code,
-                on_stdout=lambda msg: stdout_parts.append(msg.line),
-                on_stderr=lambda msg: stderr_parts.append(msg.line),
+                on_stdout=_line_writer(stdout_buf),
+                on_stderr=_line_writer(stderr_buf),
                 timeout=timeout,
             )
 
-            stdout = "\n".join(stdout_parts)
-            stderr = "\n".join(stderr_parts)
+            stdout = stdout_buf.getvalue()
+            stderr = stderr_buf.getvalue()
 
             # E2B execution.error is set if the code raised an exception
             if execution.error:
-                return stdout, f"{stderr}\n{execution.error.name}: {execution.error.value}", 1
+                error_line = f"{execution.error.name}: {execution.error.value}"
+                return stdout, f"{stderr}\n{error_line}", 1, []
 
-            return stdout, stderr, 0
+            return stdout, stderr, 0, await _missing_files(sandbox, expected_files)
         finally:
             await sandbox.kill()
@@ -4,8 +4,10 @@ Use case: "Extract email and phone from this website" — worker must return
 JSON matching the buyer's schema exactly.
 
 Verification flow:
-    1. Parse the payload as JSON.
-    2. Validate against the requirements_schema from the contract.
+    1. Parse the payload as JSON (skipped if the caller passes payload_obj).
+    2. Validate against the requirements_schema from the contract: a
+       fastjsonschema-compiled function accepts valid payloads cheaply, and
+       only rejected payloads are walked by jsonschema for full diagnostics.
     3. Return pass/fail with detailed validation errors.
 
 No external services required — this is a pure local check.
@@ -13,9 +15,14 @@ No external services required — this is a pure local check.
 
 from __future__ import annotations
 
+import hashlib
 import json
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
+import fastjsonschema
 import jsonschema
+import orjson
 from jsonschema import Draft7Validator
 
 from agentic_clearinghouse.domain.verifier_protocol import (
@@ -24,19 +31,77 @@ from agentic_clearinghouse.domain.verifier_protocol import (
 )
 from agentic_clearinghouse.logging_config import get_logger
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
 logger = get_logger(__name__)
 
+# Compiled validators kept (one per distinct schema)
+VALIDATOR_CACHE_SIZE = 256
+
+# Marks "no pre-parsed payload given" (None is a valid JSON document)
+_UNPARSED: Any = object()
+
+
+@lru_cache(maxsize=VALIDATOR_CACHE_SIZE)
+def _get_validator(schema_json: bytes) -> Draft7Validator:
+    """Build (once) the validator for a schema given as canonical JSON.
+
+    Keyed on the serialized schema rather than the dict so that every
+    submission against the same contract reuses one compiled validator.
+    """
+    return Draft7Validator(orjson.loads(schema_json))
+
+
+@lru_cache(maxsize=VALIDATOR_CACHE_SIZE)
+def _get_fast_validator(schema_json: bytes) -> Callable[[Any], Any]:
+    """Compile (once) the fastjsonschema accept check for a canonical-JSON schema.
+
+    Defaults are not injected into the payload and formats are not checked,
+    matching Draft7Validator without a format checker.
+
+    Raises:
+        fastjsonschema.JsonSchemaDefinitionException: If the schema is invalid.
+    """
+    return fastjsonschema.compile(
+        orjson.loads(schema_json), use_default=False, use_formats=False
+    )
+
+
+def _parse_payload(payload: str) -> Any:
+    """Parse a JSON payload, using orjson on the fast path.
+
+    orjson rejects a few things the stdlib accepts (NaN/Infinity, integers
+    beyond 64 bits), so a failed parse is retried with json.loads. Only
+    truly malformed payloads pay for both, and the stdlib's error message
+    is the one reported.
+    """
+    try:
+        return orjson.loads(payload)
+    except orjson.JSONDecodeError:
+        return json.loads(payload)
+
 
 class SchemaVerifier:
     """Verifier that checks JSON payloads against a JSON Schema."""
 
-    async def verify(self, request: VerificationRequest) -> VerificationResult:
+    async def verify(
+        self,
+        request: VerificationRequest,
+        *,
+        payload_obj: Any = _UNPARSED,
+    ) -> VerificationResult:
         """Validate the payload against the requirements_schema.
 
         Args:
             request: Must have:
                 - payload: A JSON string to validate.
                 - requirements_schema: A JSON Schema dict to validate against.
+                - verification_config: Optional "verbose_logs" (bool) to keep the
+                  full schema and parsed payload in the logs of a passing result.
+            payload_obj: The already-decoded payload, for callers that hold it
+                anyway. Skips the JSON parse; request.payload must be its
+                JSON text, since it is still used for logging.
 
         Returns:
             VerificationResult with is_valid=True if the payload matches the schema.
@@ -56,7 +121,9 @@ class SchemaVerifier:
 
         # --- Step 2: Parse the payload as JSON ---
         try:
-            parsed_payload = json.loads(request.payload)
+            parsed_payload = (
+                _parse_payload(request.payload) if payload_obj is _UNPARSED else payload_obj
+            )
         except (json.JSONDecodeError, TypeError) as exc:
             logger.warning(
                 "verifier.schema.json_parse_failed",
@@ -72,9 +139,22 @@ class SchemaVerifier:
 
         # --- Step 3: Validate against the JSON Schema ---
         try:
-            # Use Draft7Validator for explicit schema validation
-            validator = Draft7Validator(request.requirements_schema)
-            errors = sorted(validator.iter_errors(parsed_payload), key=lambda e: list(e.path))
+            schema_json = orjson.dumps(request.requirements_schema, option=orjson.OPT_SORT_KEYS)
+
+            # Fast tier: compiled check accepts valid payloads without diagnostics
+            try:
+                _get_fast_validator(schema_json)(parsed_payload)
+                errors = []
+            except fastjsonschema.JsonSchemaValueException:
+                # Slow tier: Draft7Validator stays authoritative and lists every error
+                errors_iter = _get_validator(schema_json).iter_errors(parsed_payload)
+                first = next(errors_iter, None)
+                errors = []
+                if first is not None:
+                    # Materialize and sort only once there is something to report
+                    errors = [first, *errors_iter]
+                    if len(errors) > 1:
+                        errors.sort(key=lambda e: tuple(e.path))
 
             if errors:
                 error_details = []
@@ -106,26 +186,37 @@ class SchemaVerifier:
                 contract_id=request.contract_id,
             )
 
+            # Echoing schema + payload back costs serialization downstream on every
+            # success, so by default only fingerprint them
+            if request.verification_config.get("verbose_logs", False):
+                logs = {
+                    "schema": request.requirements_schema,
+                    "parsed_payload": parsed_payload,
+                }
+            else:
+                logs = {
+                    "schema_hash": hashlib.blake2b(schema_json, digest_size=16).hexdigest(),
+                    "payload_bytes": len(request.payload.encode()),
+                }
+
             return VerificationResult(
                 is_valid=True,
                 score=1.0,
                 details="Payload successfully validated against the JSON Schema.",
-                logs={
-                    "schema": request.requirements_schema,
-                    "parsed_payload": parsed_payload,
-                },
+                logs=logs,
             )
 
-        except jsonschema.SchemaError as exc:
+        except (jsonschema.SchemaError, fastjsonschema.JsonSchemaDefinitionException) as exc:
             # The schema itself is malformed
             logger.error(
                 "verifier.schema.invalid_schema",
                 contract_id=request.contract_id,
                 error=str(exc),
             )
+            message = exc.message if isinstance(exc, jsonschema.SchemaError) else str(exc)
             return VerificationResult(
                 is_valid=False,
-                details=f"The requirements_schema itself is invalid: {exc.message}",
+                details=f"The requirements_schema itself is invalid: {message}",
                 error="INVALID_SCHEMA",
             )
         except Exception as exc:
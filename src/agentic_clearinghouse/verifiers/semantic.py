@@ -17,8 +17,14 @@ The judge prompt is designed to be strict and deterministic:
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import re
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+import httpx
 import litellm
-from tenacity import retry, stop_after_attempt, wait_exponential
 
 from agentic_clearinghouse.config import get_settings
 from agentic_clearinghouse.domain.verifier_protocol import (
@@ -27,8 +33,14 @@ from agentic_clearinghouse.domain.verifier_protocol import (
 )
 from agentic_clearinghouse.logging_config import get_logger
 
+if TYPE_CHECKING:
+    from collections.abc import MutableMapping
+
 logger = get_logger(__name__)
 
+# Cached judge outcome: (verdict, score, reasoning, raw LLM response)
+Verdict = tuple[bool, float, str, str]
+
 # --- Judge System Prompt ---
 JUDGE_SYSTEM_PROMPT = """You are an impartial, strict verification judge for an AI escrow system.
 
@@ -55,6 +67,78 @@ JUDGE_USER_TEMPLATE = """## Criteria
 
 Evaluate whether the submitted work meets the criteria above."""
 
+# JUDGE_USER_TEMPLATE pre-split around its placeholders, so building the prompt is
+# plain concatenation instead of re-parsing the template with str.format per call
+_JUDGE_PREFIX, _JUDGE_MID, _JUDGE_SUFFIX = re.split(
+    r"\{criteria\}|\{payload\}", JUDGE_USER_TEMPLATE
+)
+
+# One judge field per line, e.g. "SCORE: 0.85" — labels are case-insensitive
+_JUDGE_FIELD_RE = re.compile(
+    r"^[ \t]*(VERDICT|SCORE|REASONING)[ \t]*:(.*)$",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+# A VERDICT line the judge actually answered, i.e. not the parser's FALSE fallback
+_JUDGE_VERDICT_RE = re.compile(
+    r"^[ \t]*VERDICT[ \t]*:[ \t]*(TRUE|FALSE)[ \t]*$",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+# Shared HTTP client for judge calls (initialized lazily on first call)
+_http_client: httpx.AsyncClient | None = None
+_http_client_loop: asyncio.AbstractEventLoop | None = None
+
+# Judge calls: up to two retries, 2s apart (exponential backoff from 2s, capped)
+LLM_ATTEMPTS = 3
+LLM_MAX_BACKOFF_SECONDS = 10
+
+# Max verdicts kept per verifier (LRU) when caching is enabled
+VERDICT_CACHE_SIZE = 1024
+
+# Judge calls currently awaiting the LLM, keyed by everything that shapes the answer.
+# Concurrent identical verifications (retry storms, duplicate contracts) share one call.
+_IN_FLIGHT: dict[tuple[str, int, float, str, str], asyncio.Future[str]] = {}
+
+
+async def _ensure_http_client() -> None:
+    """Point LiteLLM at the pooled HTTP/2 client it sends judge calls through.
+
+    One keep-alive pool multiplexes concurrent judge calls over a few
+    connections instead of paying a TLS handshake per call. A client is tied
+    to the event loop it was first used on, so a new loop gets a new client
+    and the old one is closed rather than leaking its connection pool.
+    """
+    global _http_client, _http_client_loop
+    loop = asyncio.get_running_loop()
+    if _http_client is not None and _http_client_loop is loop:
+        return
+
+    stale = _http_client
+    _http_client = httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        timeout=60,
+    )
+    _http_client_loop = loop
+    litellm.aclient_session = _http_client
+    if stale is not None:
+        try:
+            await stale.aclose()
+        except Exception as exc:
+            # Its connections belong to the old (possibly closed) loop
+            logger.warning("verifier.semantic.stale_client_close_failed", error=str(exc))
+
+
+async def close_http_client() -> None:
+    """Close the shared judge HTTP client. Called during app shutdown."""
+    global _http_client, _http_client_loop
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+        _http_client_loop = None
+        litellm.aclient_session = None
+
 
 class SemanticVerifier:
     """Verifier that uses an LLM judge to evaluate subjective work quality."""
@@ -65,24 +149,45 @@ class SemanticVerifier:
         fallback_models: list[str] | None = None,
         max_tokens: int | None = None,
         temperature: float | None = None,
+        use_cache: bool = True,
+        verdict_cache: MutableMapping[str, Verdict] | None = None,
     ) -> None:
-        """Initialize with optional overrides (defaults come from config)."""
+        """Initialize with optional overrides (defaults come from config).
+
+        Args:
+            use_cache: Reuse the verdict for a (criteria, payload) pair judged
+                before. Disable for criteria where the judge is expected to
+                answer differently on each call.
+            verdict_cache: Store for verdicts keyed by a hash of (model,
+                criteria, payload), e.g. a shelve or diskcache mapping shared
+                across processes. Defaults to an in-memory LRU of
+                VERDICT_CACHE_SIZE entries; a custom store manages its own size.
+        """
         self._model = model
         self._fallback_models = fallback_models
         self._max_tokens = max_tokens
         self._temperature = temperature
+        self._use_cache = use_cache
+        self._model_config: dict | None = None
+        self._verdict_cache: MutableMapping[str, Verdict] = (
+            verdict_cache if verdict_cache is not None else OrderedDict()
+        )
 
     def _get_model_config(self) -> dict:
-        """Resolve model configuration from overrides or settings."""
-        settings = get_settings()
-        return {
-            "model": self._model or settings.litellm_model,
-            "fallback_models": self._fallback_models or settings.litellm_fallback_model_list,
-            "max_tokens": self._max_tokens or settings.litellm_max_tokens,
-            "temperature": (
-                self._temperature if self._temperature is not None else settings.litellm_temperature
-            ),
-        }
+        """Resolve model configuration from overrides or settings (once per instance)."""
+        if self._model_config is None:
+            settings = get_settings()
+            self._model_config = {
+                "model": self._model or settings.litellm_model,
+                "fallback_models": self._fallback_models or settings.litellm_fallback_model_list,
+                "max_tokens": self._max_tokens or settings.litellm_max_tokens,
+                "temperature": (
+                    self._temperature
+                    if self._temperature is not None
+                    else settings.litellm_temperature
+                ),
+            }
+        return self._model_config
 
     async def verify(self, request: VerificationRequest) -> VerificationResult:
         """Evaluate the payload against semantic criteria using an LLM judge.
@@ -90,7 +195,8 @@ class SemanticVerifier:
         Args:
             request: Must have:
                 - payload: The submitted work to evaluate.
-                - verification_config: Must contain "criteria" key.
+                - verification_config: Must contain "criteria" key. Optional
+                  "cache" (bool) overrides the verifier's use_cache setting.
 
         Returns:
             VerificationResult with is_valid based on the LLM's verdict.
@@ -109,9 +215,31 @@ class SemanticVerifier:
             criteria_preview=criteria[:100],
         )
 
+        model = self._get_model_config()["model"]
+        cache_key = None
+        if request.verification_config.get("cache", self._use_cache):
+            cache_key = hashlib.blake2b(
+                f"{model}\x00{criteria}\x00{request.payload}".encode(), digest_size=16
+            ).hexdigest()
+
         try:
-            llm_response = await self._call_llm(criteria, request.payload)
-            verdict, score, reasoning = self._parse_response(llm_response)
+            cached = self._verdict_cache.get(cache_key) if cache_key else None
+            if cached is not None:
+                if isinstance(self._verdict_cache, OrderedDict):
+                    self._verdict_cache.move_to_end(cache_key)
+                verdict, score, reasoning, llm_response = cached
+                logger.info("verifier.semantic.cache_hit", contract_id=request.contract_id)
+            else:
+                llm_response = await self._judge(criteria, request.payload)
+                verdict, score, reasoning = self._parse_response(llm_response)
+                # A malformed reply would otherwise pin its fallback FAIL on the payload
+                if cache_key and _JUDGE_VERDICT_RE.search(llm_response):
+                    self._verdict_cache[cache_key] = (verdict, score, reasoning, llm_response)
+                    if (
+                        isinstance(self._verdict_cache, OrderedDict)
+                        and len(self._verdict_cache) > VERDICT_CACHE_SIZE
+                    ):
+                        self._verdict_cache.popitem(last=False)
 
             logger.info(
                 "verifier.semantic.result",
@@ -127,7 +255,7 @@ class SemanticVerifier:
                 logs={
                     "llm_response": llm_response,
                     "criteria": criteria,
-                    "model": self._get_model_config()["model"],
+                    "model": model,
                 },
             )
 
@@ -143,22 +271,47 @@ class SemanticVerifier:
                 logs={"exception": str(exc)},
             )
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        reraise=True,
-    )
-    async def _call_llm(self, criteria: str, payload: str) -> str:
-        """Call the LLM via LiteLLM with retry logic.
+    async def _judge(self, criteria: str, payload: str) -> str:
+        """Call the LLM judge, joining an identical call already in flight.
 
-        Uses tenacity for exponential backoff on transient failures.
+        Each prompt still carries exactly one submission: batching several
+        workers' payloads into one prompt would let one submission steer the
+        verdict on another.
         """
         config = self._get_model_config()
+        key = (config["model"], config["max_tokens"], config["temperature"], criteria, payload)
 
-        user_message = JUDGE_USER_TEMPLATE.format(
-            criteria=criteria,
-            payload=payload,
-        )
+        pending = _IN_FLIGHT.get(key)
+        if pending is not None:
+            logger.debug("verifier.semantic.joined_in_flight")
+            return await asyncio.shield(pending)
+
+        task = asyncio.ensure_future(self._call_llm(criteria, payload))
+        _IN_FLIGHT[key] = task
+        try:
+            return await asyncio.shield(task)
+        finally:
+            if _IN_FLIGHT.get(key) is task:
+                del _IN_FLIGHT[key]
+
+    async def _call_llm(self, criteria: str, payload: str) -> str:
+        """Call the LLM via LiteLLM, retrying transient failures with exponential backoff."""
+        attempt = 1
+        while True:
+            try:
+                return await self._call_llm_once(criteria, payload)
+            except Exception:
+                if attempt >= LLM_ATTEMPTS:
+                    raise
+                await asyncio.sleep(min(LLM_MAX_BACKOFF_SECONDS, 2 ** max(1, attempt - 1)))
+                attempt += 1
+
+    async def _call_llm_once(self, criteria: str, payload: str) -> str:
+        """Make a single judge call via LiteLLM and return the response text."""
+        config = self._get_model_config()
+        await _ensure_http_client()
+
+        user_message = f"{_JUDGE_PREFIX}{criteria}{_JUDGE_MID}{payload}{_JUDGE_SUFFIX}"
 
         response = await litellm.acompletion(
             model=config["model"],
@@ -190,28 +343,27 @@ class SemanticVerifier:
         verdict = False
         score = 0.0
         reasoning = ""
-
-        for line in response.split("\n"):
-            line = line.strip()
-            if line.upper().startswith("VERDICT:"):
-                verdict_str = line.split(":", 1)[1].strip().upper()
-                verdict = verdict_str == "TRUE"
-            elif line.upper().startswith("SCORE:"):
+        reasoning_start: int | None = None
+
+        for match in _JUDGE_FIELD_RE.finditer(response):
+            # REASONING runs until the next field label (or the end of the response)
+            if reasoning_start is not None:
+                reasoning = response[reasoning_start : match.start()].strip()
+                reasoning_start = None
+
+            field, value = match.group(1).upper(), match.group(2).strip()
+            if field == "VERDICT":
+                verdict = value.upper() == "TRUE"
+            elif field == "SCORE":
                 try:
-                    score = float(line.split(":", 1)[1].strip())
-                    score = max(0.0, min(1.0, score))  # Clamp to [0, 1]
-                except (ValueError, IndexError):
+                    score = max(0.0, min(1.0, float(value)))  # Clamp to [0, 1]
+                except ValueError:
                     score = 0.0
-            elif line.upper().startswith("REASONING:"):
-                reasoning = line.split(":", 1)[1].strip()
-
-        # If reasoning spans multiple lines after the label
-        if not reasoning and "REASONING:" in response.upper():
-            parts = response.upper().split("REASONING:", 1)
-            if len(parts) > 1:
-                # Get everything after REASONING: from the original (case-preserved) text
-                idx = response.upper().index("REASONING:") + len("REASONING:")
-                reasoning = response[idx:].strip()
+            else:
+                reasoning_start = match.start(2)
+
+        if reasoning_start is not None:
+            reasoning = response[reasoning_start:].strip()
 
         if not reasoning:
             reasoning = (
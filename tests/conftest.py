@@ -4,15 +4,76 @@ Provides:
     - In-memory or test database sessions
     - Factory functions for creating test data
     - Async test support via pytest-asyncio
+    - retry_async for integration calls against flaky external APIs
+    - recorded_sleeps to check retry backoff without waiting it out
 """
 
 from __future__ import annotations
 
+import asyncio
 import uuid
 from decimal import Decimal
+from typing import TYPE_CHECKING, TypeVar
 
 import pytest
 
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+T = TypeVar("T")
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Register command-line options for the integration suite."""
+    parser.addoption(
+        "--no-llm-cache",
+        action="store_true",
+        default=False,
+        help="Call the real LLM judge instead of replaying verdicts cached on disk.",
+    )
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+async def retry_async(
+    call: Callable[[], Awaitable[T]],
+    should_retry: Callable[[T], bool],
+    tries: int = 3,
+    wait: float = 1.0,
+    timeout: float = 60.0,
+) -> T:
+    """Await `call()` until `should_retry` rejects its result or `tries` run out.
+
+    Each attempt is bounded by `timeout` seconds and attempts are `wait`
+    seconds apart. The last attempt's result is returned either way, so the
+    test still asserts on a real outcome instead of the whole suite being
+    rerun for one transient failure.
+    """
+    attempt = 1
+    while True:
+        result = await asyncio.wait_for(call(), timeout)
+        if attempt >= tries or not should_retry(result):
+            return result
+        attempt += 1
+        await asyncio.sleep(wait)
+
+
+@pytest.fixture
+def recorded_sleeps(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    """Make asyncio.sleep return immediately, recording each requested delay."""
+    delays: list[float] = []
+
+    async def sleep(delay: float, result: object = None) -> object:
+        delays.append(delay)
+        return result
+
+    monkeypatch.setattr(asyncio, "sleep", sleep)
+    return delays
+
+
 # ---------------------------------------------------------------------------
 # Domain Fixtures
 # ---------------------------------------------------------------------------
@@ -13,6 +13,7 @@ import pytest
 from statemachine.exceptions import TransitionNotAllowed
 
 from agentic_clearinghouse.domain.state_machine import (
+    TRANSITION_TABLE,
     EscrowStateMachine,
     validate_transition,
 )
@@ -155,3 +156,21 @@ class TestValidateTransitionFunction:
     def test_invalid_status(self) -> None:
         with pytest.raises(ValueError, match="Unknown status"):
             EscrowStateMachine("INVALID_STATUS")
+
+
+class TestTransitionTable:
+    """The precomputed table must agree with the state machine for every pair."""
+
+    @pytest.mark.parametrize("status", [s.value for s in EscrowStateMachine.states])
+    def test_matches_state_machine(self, status: str) -> None:
+        for event in EscrowStateMachine.events:
+            expected = TRANSITION_TABLE.get((status, event.name))
+            if expected is None:
+                with pytest.raises(TransitionNotAllowed):
+                    validate_transition(status, event.name)
+            else:
+                assert validate_transition(status, event.name) == expected
+
+    def test_dispute_has_two_sources(self) -> None:
+        assert TRANSITION_TABLE[("FUNDED", "buyer_disputes")] == "DISPUTED"
+        assert TRANSITION_TABLE[("IN_PROGRESS", "buyer_disputes")] == "DISPUTED"
@@ -0,0 +1,176 @@
+"""Tests for the background audit event writer.
+
+Runs EventRepository.record() against an in-memory aiosqlite database with
+the writer started, and checks that rows:
+    1. Reach the queue only once the transition commits.
+    2. Are discarded when the transition rolls back.
+    3. Are inserted inline when the queue is over its high watermark.
+    4. Are all written by the time stop_event_writer() returns.
+"""
+
+from __future__ import annotations
+
+import uuid
+from typing import TYPE_CHECKING, Any
+
+import pytest_asyncio
+from sqlalchemy import func, select
+from sqlalchemy.dialects import sqlite as sqlite_dialect
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from agentic_clearinghouse.config import get_settings
+from agentic_clearinghouse.domain.enums import EscrowStatus, EventType
+from agentic_clearinghouse.infrastructure.database import event_writer
+from agentic_clearinghouse.infrastructure.database.orm_models import Base, EscrowEvent
+from agentic_clearinghouse.infrastructure.database.repositories import EventRepository
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    import pytest
+
+
+@pytest_asyncio.fixture
+async def session_factory(
+    monkeypatch: pytest.MonkeyPatch,
+) -> AsyncIterator[async_sessionmaker[AsyncSession]]:
+    """In-memory SQLite database wired into the event writer, which is left running."""
+    # SQLite has no JSONB; compile it as JSON like simulation.py does
+    monkeypatch.setattr(
+        sqlite_dialect.base.SQLiteTypeCompiler,
+        "visit_JSONB",
+        sqlite_dialect.base.SQLiteTypeCompiler.visit_JSON,
+        raising=False,
+    )
+    settings = get_settings()
+    monkeypatch.setattr(settings, "event_log_async", True)
+    monkeypatch.setattr(settings, "event_log_flush_interval_ms", 1)
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    factory = async_sessionmaker(bind=engine, expire_on_commit=False, autoflush=False)
+    monkeypatch.setattr(event_writer, "_get_session_factory", lambda: factory)
+
+    await event_writer.start_event_writer()
+    yield factory
+    await event_writer.stop_event_writer()
+    await engine.dispose()
+
+
+async def _record(session: AsyncSession, contract_id: uuid.UUID) -> None:
+    await EventRepository(session).record(
+        contract_id=contract_id,
+        event_type=EventType.CONTRACT_FUNDED,
+        old_status=EscrowStatus.CREATED,
+        new_status=EscrowStatus.FUNDED,
+    )
+
+
+async def _count(factory: async_sessionmaker[AsyncSession], contract_id: uuid.UUID) -> int:
+    async with factory() as session:
+        return await session.scalar(
+            select(func.count()).where(EscrowEvent.contract_id == contract_id)
+        )
+
+
+class TestEventWriter:
+    """Audit rows follow the fate of the transaction that recorded them."""
+
+    async def test_rows_enqueued_only_after_commit(
+        self, session_factory: async_sessionmaker[AsyncSession]
+    ) -> None:
+        contract_id = uuid.uuid4()
+        async with session_factory() as session:
+            await _record(session, contract_id)
+            assert event_writer._queue is not None
+            assert event_writer._queue.qsize() == 0
+            assert await _count(session_factory, contract_id) == 0
+
+            await session.commit()
+
+        await event_writer.stop_event_writer()
+        assert await _count(session_factory, contract_id) == 1
+
+    async def test_rows_discarded_on_rollback(
+        self, session_factory: async_sessionmaker[AsyncSession]
+    ) -> None:
+        contract_id = uuid.uuid4()
+        async with session_factory() as session:
+            await _record(session, contract_id)
+            await session.rollback()
+            assert event_writer._PENDING_KEY not in session.info
+
+        await event_writer.stop_event_writer()
+        assert await _count(session_factory, contract_id) == 0
+
+    async def test_high_watermark_falls_back_to_inline_insert(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(get_settings(), "event_log_queue_high_watermark", 0)
+        contract_id = uuid.uuid4()
+        async with session_factory() as session:
+            await _record(session, contract_id)
+
+            # Flushed into the caller's own transaction, nothing buffered
+            assert event_writer._PENDING_KEY not in session.info
+            events = await EventRepository(session).get_by_contract(contract_id)
+            assert len(events) == 1
+            await session.commit()
+
+        assert await _count(session_factory, contract_id) == 1
+
+    async def test_stop_drains_queue(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(get_settings(), "event_log_batch_size", 2)
+        contract_id = uuid.uuid4()
+        for _ in range(5):
+            async with session_factory() as session:
+                await _record(session, contract_id)
+                await session.commit()
+
+        await event_writer.stop_event_writer()
+        assert await _count(session_factory, contract_id) == 5
+
+    async def test_commit_after_stop_still_writes(
+        self, session_factory: async_sessionmaker[AsyncSession]
+    ) -> None:
+        contract_id = uuid.uuid4()
+        async with session_factory() as session:
+            await _record(session, contract_id)
+            await event_writer.stop_event_writer()
+            await session.commit()
+
+        await event_writer.stop_event_writer()
+        assert await _count(session_factory, contract_id) == 1
+
+    async def test_failed_batch_falls_back_to_row_inserts(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        insert_rows = event_writer._insert
+        attempts: list[int] = []
+
+        async def reject_batches(rows: list[dict[str, Any]]) -> None:
+            attempts.append(len(rows))
+            if len(rows) > 1:
+                raise RuntimeError("batch rejected")
+            await insert_rows(rows)
+
+        monkeypatch.setattr(event_writer, "_insert", reject_batches)
+        monkeypatch.setattr(event_writer, "EVENT_LOG_RETRY_BACKOFF_SECONDS", 0)
+        contract_id = uuid.uuid4()
+        async with session_factory() as session:
+            await _record(session, contract_id)
+            await _record(session, contract_id)
+            await session.commit()
+
+        await event_writer.stop_event_writer()
+        assert attempts == [2] * event_writer.EVENT_LOG_WRITE_ATTEMPTS + [1, 1]
+        assert await _count(session_factory, contract_id) == 2
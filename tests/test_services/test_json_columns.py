@@ -0,0 +1,77 @@
+"""Tests for the JSON/JSONB column codec the database engine is built with.
+
+orjson only handles 64-bit integers, so values beyond that range must still
+round-trip through the stdlib json fallback unchanged.
+"""
+
+from __future__ import annotations
+
+import uuid
+from datetime import UTC, datetime
+from typing import Any
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import sqlite as sqlite_dialect
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from agentic_clearinghouse.infrastructure.database.engine import (
+    _json_deserializer,
+    _json_serializer,
+)
+from agentic_clearinghouse.infrastructure.database.orm_models import Base, EscrowEvent
+
+BIG_INT = 2**70
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        {"maximum": BIG_INT, "minimum": -BIG_INT},
+        {"expected_output": "55", "score": 0.5, "ids": [1, 2, 3]},
+    ],
+    ids=["beyond_64_bits", "plain"],
+)
+def test_codec_round_trip(value: Any) -> None:
+    assert _json_deserializer(_json_serializer(value)) == value
+
+
+async def test_big_int_round_trips_through_jsonb_column(monkeypatch: pytest.MonkeyPatch) -> None:
+    # SQLite has no JSONB; compile it as JSON like simulation.py does
+    monkeypatch.setattr(
+        sqlite_dialect.base.SQLiteTypeCompiler,
+        "visit_JSONB",
+        sqlite_dialect.base.SQLiteTypeCompiler.visit_JSON,
+        raising=False,
+    )
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        json_serializer=_json_serializer,
+        json_deserializer=_json_deserializer,
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+
+    event_id = uuid.uuid4()
+    async with factory() as session:
+        session.add(
+            EscrowEvent(
+                id=event_id,
+                contract_id=uuid.uuid4(),
+                event_type="VERIFICATION_PASSED",
+                new_status="COMPLETED",
+                actor="SYSTEM",
+                metadata_json={"expected_output": BIG_INT},
+                created_at=datetime.now(UTC),
+            )
+        )
+        await session.commit()
+
+    async with factory() as session:
+        stored = await session.scalar(
+            select(EscrowEvent.metadata_json).where(EscrowEvent.id == event_id)
+        )
+    await engine.dispose()
+
+    assert stored == {"expected_output": BIG_INT}
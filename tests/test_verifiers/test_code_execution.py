@@ -6,13 +6,24 @@ Integration tests with a real sandbox are in test_integration.py.
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, patch
+import asyncio
+import io
+import sys
+from collections.abc import Callable
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any
+from unittest.mock import AsyncMock
 
 import pytest
 
+from agentic_clearinghouse.config import get_settings
 from agentic_clearinghouse.domain.verifier_protocol import VerificationRequest
+from agentic_clearinghouse.verifiers import code_execution
 from agentic_clearinghouse.verifiers.code_execution import CodeExecutionVerifier
 
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Sequence
+
 
 def _make_request(
     payload: str = 'print("55")',
@@ -30,134 +41,486 @@ def _make_request(
     )
 
 
+# Shared by tests that only read the request; tests that edit verification_config
+# build their own with _make_request()
+DEFAULT_REQUEST = _make_request()
+
+
+def _async_return(value: tuple) -> Callable[..., Awaitable[tuple]]:
+    async def run(*args: Any, **kwargs: Any) -> tuple:
+        return value
+
+    return run
+
+
+def _async_raise(exc: Exception) -> Callable[..., Awaitable[tuple]]:
+    async def run(*args: Any, **kwargs: Any) -> tuple:
+        raise exc
+
+    return run
+
+
+StubInstaller = Callable[[tuple | Exception], None]
+
+
+@pytest.fixture
+def stub_sandbox(monkeypatch: pytest.MonkeyPatch) -> StubInstaller:
+    """Install a plain coroutine as the E2B round-trip, returning or raising `outcome`.
+
+    Cheaper than AsyncMock, which records every call; use mocked_sandbox only
+    when a test inspects the call.
+    """
+
+    def install(outcome: tuple | Exception) -> None:
+        stub = _async_raise(outcome) if isinstance(outcome, Exception) else _async_return(outcome)
+        monkeypatch.setattr(CodeExecutionVerifier, "_run_in_sandbox", stub)
+
+    return install
+
+
+@pytest.fixture
+def mocked_sandbox(monkeypatch: pytest.MonkeyPatch) -> AsyncMock:
+    """Replace the E2B round-trip; tests set return_value / side_effect directly."""
+    mock = AsyncMock()
+    monkeypatch.setattr(CodeExecutionVerifier, "_run_in_sandbox", mock)
+    return mock
+
+
 class TestCodeExecutionHappyPath:
-    @pytest.mark.asyncio
-    async def test_correct_output_passes(self) -> None:
+    async def test_correct_output_passes(self, stub_sandbox: StubInstaller) -> None:
         verifier = CodeExecutionVerifier(api_key="test-key")
 
-        with patch.object(
-            verifier, "_run_in_sandbox", new_callable=AsyncMock
-        ) as mock_run:
-            mock_run.return_value = ("55", "", 0)
-            result = await verifier.verify(_make_request())
+        stub_sandbox(("55", "", 0, []))
+        result = await verifier.verify(DEFAULT_REQUEST)
 
         assert result.is_valid is True
         assert result.score == 1.0
         assert "55" in result.details
 
-    @pytest.mark.asyncio
-    async def test_no_expected_output_passes_on_exit_zero(self) -> None:
+    async def test_no_expected_output_passes_on_exit_zero(
+        self, stub_sandbox: StubInstaller
+    ) -> None:
         verifier = CodeExecutionVerifier(api_key="test-key")
 
-        with patch.object(
-            verifier, "_run_in_sandbox", new_callable=AsyncMock
-        ) as mock_run:
-            mock_run.return_value = ("hello world", "", 0)
-            result = await verifier.verify(
-                _make_request(expected_output="", payload='print("hello world")')
-            )
+        stub_sandbox(("hello world", "", 0, []))
+        result = await verifier.verify(
+            _make_request(expected_output="", payload='print("hello world")')
+        )
 
         assert result.is_valid is True
         assert "exit code 0" in result.details
 
 
 class TestCodeExecutionFailures:
-    @pytest.mark.asyncio
-    async def test_nonzero_exit_code_fails(self) -> None:
+    @pytest.mark.parametrize(
+        ("sandbox_result", "expected_error", "expected_detail"),
+        [
+            (("", "NameError: name 'x' is not defined", 1, []), None, "non-zero exit code"),
+            (("42", "", 0, []), None, "doesn't match"),
+            (TimeoutError("Sandbox timed out"), "EXECUTION_TIMEOUT", "timed out"),
+            (RuntimeError("E2B API error"), "SANDBOX_ERROR", "E2B API error"),
+        ],
+        ids=["nonzero_exit_code", "wrong_output", "timeout", "sandbox_exception"],
+    )
+    async def test_failure_modes(
+        self,
+        stub_sandbox: StubInstaller,
+        sandbox_result: tuple | Exception,
+        expected_error: str | None,
+        expected_detail: str,
+    ) -> None:
         verifier = CodeExecutionVerifier(api_key="test-key")
 
-        with patch.object(
-            verifier, "_run_in_sandbox", new_callable=AsyncMock
-        ) as mock_run:
-            mock_run.return_value = ("", "NameError: name 'x' is not defined", 1)
-            result = await verifier.verify(_make_request())
+        stub_sandbox(sandbox_result)
+        result = await verifier.verify(DEFAULT_REQUEST)
 
         assert result.is_valid is False
-        assert "non-zero exit code" in result.details
-        assert result.logs["exit_code"] == 1
+        assert result.error == expected_error
+        assert expected_detail in result.details
 
-    @pytest.mark.asyncio
-    async def test_wrong_output_fails(self) -> None:
+    async def test_nonzero_exit_code_logged(self, stub_sandbox: StubInstaller) -> None:
         verifier = CodeExecutionVerifier(api_key="test-key")
 
-        with patch.object(
-            verifier, "_run_in_sandbox", new_callable=AsyncMock
-        ) as mock_run:
-            mock_run.return_value = ("42", "", 0)
-            result = await verifier.verify(_make_request(expected_output="55"))
+        stub_sandbox(("", "NameError: name 'x' is not defined", 1, []))
+        result = await verifier.verify(DEFAULT_REQUEST)
+
+        assert result.logs["exit_code"] == 1
+
+
+class TestCodeExecutionConfig:
+    async def test_missing_api_key_fails(self) -> None:
+        verifier = CodeExecutionVerifier(api_key="")  # explicitly empty
+        result = await verifier.verify(DEFAULT_REQUEST)
 
         assert result.is_valid is False
-        assert "doesn't match" in result.details
+        assert result.error == "MISSING_E2B_API_KEY"
 
-    @pytest.mark.asyncio
-    async def test_timeout_fails(self) -> None:
+    async def test_expected_output_partial_match(self, stub_sandbox: StubInstaller) -> None:
+        """Expected output uses 'in' check, not exact match."""
         verifier = CodeExecutionVerifier(api_key="test-key")
 
-        with patch.object(
-            verifier, "_run_in_sandbox", new_callable=AsyncMock
-        ) as mock_run:
-            mock_run.side_effect = TimeoutError("Sandbox timed out")
-            result = await verifier.verify(_make_request())
+        stub_sandbox(("The answer is 55, hooray!", "", 0, []))
+        result = await verifier.verify(DEFAULT_REQUEST)
 
-        assert result.is_valid is False
-        assert result.error == "EXECUTION_TIMEOUT"
+        assert result.is_valid is True
 
-    @pytest.mark.asyncio
-    async def test_sandbox_exception_fails(self) -> None:
+    async def test_null_expected_output_checks_exit_code_only(
+        self, stub_sandbox: StubInstaller
+    ) -> None:
         verifier = CodeExecutionVerifier(api_key="test-key")
+        request = _make_request()
+        request.verification_config["expected_output"] = None
 
-        with patch.object(
-            verifier, "_run_in_sandbox", new_callable=AsyncMock
-        ) as mock_run:
-            mock_run.side_effect = RuntimeError("E2B API error")
-            result = await verifier.verify(_make_request())
+        stub_sandbox(("anything", "", 0, []))
+        result = await verifier.verify(request)
 
-        assert result.is_valid is False
-        assert result.error == "SANDBOX_ERROR"
+        assert result.is_valid is True
+        assert "exit code 0" in result.details
 
+    async def test_template_forwarded_to_sandbox(self, mocked_sandbox: AsyncMock) -> None:
+        verifier = CodeExecutionVerifier(api_key="test-key")
+        request = _make_request()
+        request.verification_config["template"] = "python-data"
 
-class TestCodeExecutionConfig:
-    @pytest.mark.asyncio
-    async def test_missing_api_key_fails(self) -> None:
-        verifier = CodeExecutionVerifier(api_key="")  # explicitly empty
-        result = await verifier.verify(_make_request())
+        mocked_sandbox.return_value = ("55", "", 0, [])
+        await verifier.verify(request)
 
-        assert result.is_valid is False
-        assert result.error == "MISSING_E2B_API_KEY"
+        assert mocked_sandbox.call_args.kwargs["template"] == "python-data"
 
-    @pytest.mark.asyncio
-    async def test_expected_output_partial_match(self) -> None:
-        """Expected output uses 'in' check, not exact match."""
+    async def test_single_setup_command_string_kept_whole(
+        self, mocked_sandbox: AsyncMock
+    ) -> None:
         verifier = CodeExecutionVerifier(api_key="test-key")
+        request = _make_request()
+        request.verification_config["setup_commands"] = "pip install x"
 
-        with patch.object(
-            verifier, "_run_in_sandbox", new_callable=AsyncMock
-        ) as mock_run:
-            mock_run.return_value = ("The answer is 55, hooray!", "", 0)
-            result = await verifier.verify(_make_request(expected_output="55"))
+        mocked_sandbox.return_value = ("55", "", 0, [])
+        await verifier.verify(request)
 
-        assert result.is_valid is True
+        assert mocked_sandbox.call_args.kwargs["setup_commands"] == ["pip install x"]
+
+    async def test_missing_expected_file_fails(self, mocked_sandbox: AsyncMock) -> None:
+        verifier = CodeExecutionVerifier(api_key="test-key")
+        request = _make_request()
+        request.verification_config["expected_file"] = ["out.csv", "report.txt"]
+
+        mocked_sandbox.return_value = ("55", "", 0, ["report.txt"])
+        result = await verifier.verify(request)
+
+        assert mocked_sandbox.call_args.kwargs["expected_files"] == ["out.csv", "report.txt"]
+        assert result.is_valid is False
+        assert result.logs["missing_files"] == ["report.txt"]
+        assert "report.txt" in result.details
 
 
 class TestCodeExecutionMalicious:
     """Test that malicious code scenarios are handled safely."""
 
-    @pytest.mark.asyncio
-    async def test_malicious_code_returns_nonzero(self) -> None:
+    async def test_malicious_code_returns_nonzero(self, stub_sandbox: StubInstaller) -> None:
         """If malicious code fails in sandbox, we get nonzero exit."""
         verifier = CodeExecutionVerifier(api_key="test-key")
 
-        with patch.object(
-            verifier, "_run_in_sandbox", new_callable=AsyncMock
-        ) as mock_run:
-            mock_run.return_value = (
-                "",
-                "PermissionError: Operation not permitted",
-                1,
-            )
-            result = await verifier.verify(
-                _make_request(payload='import os; os.system("rm -rf /")')
-            )
+        stub_sandbox(("", "PermissionError: Operation not permitted", 1, []))
+        result = await verifier.verify(
+            _make_request(payload='import os; os.system("rm -rf /")')
+        )
 
         assert result.is_valid is False
         assert result.logs["exit_code"] == 1
+
+
+class TestCodeExecutionResultCache:
+    async def test_cache_opt_in_skips_second_run(self, mocked_sandbox: AsyncMock) -> None:
+        verifier = CodeExecutionVerifier(api_key="test-key")
+        request = _make_request()
+        request.verification_config["cache"] = True
+
+        mocked_sandbox.return_value = ("55", "", 0, [])
+        first = await verifier.verify(request)
+        second = await verifier.verify(request)
+
+        assert mocked_sandbox.await_count == 1
+        assert second is first
+
+    async def test_no_cache_by_default(self, mocked_sandbox: AsyncMock) -> None:
+        verifier = CodeExecutionVerifier(api_key="test-key")
+
+        mocked_sandbox.return_value = ("55", "", 0, [])
+        await verifier.verify(DEFAULT_REQUEST)
+        await verifier.verify(DEFAULT_REQUEST)
+
+        assert mocked_sandbox.await_count == 2
+
+    async def test_sandbox_errors_not_cached(self, mocked_sandbox: AsyncMock) -> None:
+        verifier = CodeExecutionVerifier(api_key="test-key")
+        request = _make_request()
+        request.verification_config["cache"] = True
+
+        mocked_sandbox.side_effect = [ConnectionError("E2B unreachable"), ("55", "", 0, [])]
+        first = await verifier.verify(request)
+        second = await verifier.verify(request)
+
+        assert first.error == "SANDBOX_ERROR"
+        assert second.is_valid is True
+
+
+@pytest.fixture
+def pools(monkeypatch: pytest.MonkeyPatch) -> dict:
+    """Empty pool registry with pooling on and one allow-listed template."""
+    registry: dict = {}
+    monkeypatch.setattr(code_execution, "_POOLS", registry)
+    monkeypatch.setattr(get_settings(), "e2b_pool_min_warm", 1)
+    monkeypatch.setattr(get_settings(), "e2b_pool_templates", "pandas-env")
+    return registry
+
+
+class TestSandboxPoolSelection:
+    async def test_default_and_allow_listed_templates_are_pooled(self, pools: dict) -> None:
+        default = await code_execution._get_pool("test-key", None)
+        listed = await code_execution._get_pool("test-key", "pandas-env")
+
+        assert default is not None
+        assert listed is not None
+        assert await code_execution._get_pool("test-key", None) is default
+        assert len(pools) == 2
+
+    async def test_other_templates_boot_on_demand(self, pools: dict) -> None:
+        assert await code_execution._get_pool("test-key", "buyer-template") is None
+        assert pools == {}
+
+    async def test_pool_count_is_capped(
+        self, pools: dict, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(code_execution, "MAX_SANDBOX_POOLS", 1)
+
+        assert await code_execution._get_pool("key-a", None) is not None
+        assert await code_execution._get_pool("key-b", None) is None
+        assert len(pools) == 1
+
+
+class FakeSandbox:
+    """Stand-in for an E2B AsyncSandbox; SDK calls are AsyncMocks, kill() is recorded.
+
+    run_code() streams `stdout` / `stderr` line by line through the output
+    callbacks, and files.exists() reports only the paths in `files`.
+    """
+
+    def __init__(
+        self,
+        stdout: Sequence[str] = (),
+        stderr: Sequence[str] = (),
+        files: Sequence[str] = (),
+    ) -> None:
+        self.killed = False
+        self.stdout = stdout
+        self.stderr = stderr
+        self.commands = SimpleNamespace(run=AsyncMock())
+        self.files = SimpleNamespace(exists=AsyncMock(side_effect=lambda path: path in files))
+
+    async def run_code(
+        self,
+        code: str,
+        on_stdout: Callable[[Any], None],
+        on_stderr: Callable[[Any], None],
+        timeout: int,
+    ) -> SimpleNamespace:
+        for line in self.stdout:
+            on_stdout(SimpleNamespace(line=line))
+        for line in self.stderr:
+            on_stderr(SimpleNamespace(line=line))
+        return SimpleNamespace(error=None)
+
+    async def kill(self) -> None:
+        self.killed = True
+
+
+@pytest.fixture
+def sandbox_create(monkeypatch: pytest.MonkeyPatch) -> AsyncMock:
+    """Stub AsyncSandbox.create with a fresh FakeSandbox per call, kept in .sandboxes."""
+
+    def new_sandbox(**kwargs: Any) -> FakeSandbox:
+        create.sandboxes.append(FakeSandbox())
+        return create.sandboxes[-1]
+
+    create = AsyncMock(side_effect=new_sandbox)
+    create.sandboxes = []
+    fake_sdk = SimpleNamespace(AsyncSandbox=SimpleNamespace(create=create))
+    monkeypatch.setitem(sys.modules, "e2b_code_interpreter", fake_sdk)
+    return create
+
+
+class TestSandboxPool:
+    async def test_acquire_hands_out_warm_sandbox_and_replenishes(
+        self, sandbox_create: AsyncMock
+    ) -> None:
+        pool = code_execution._SandboxPool("test-key", None, min_warm=2, lifetime=300)
+        await pool.fill(2)
+        warm = set(sandbox_create.sandboxes)
+
+        sandbox = await pool.acquire(timeout=30)
+        await asyncio.gather(*pool._tasks)
+
+        assert sandbox in warm
+        assert sandbox_create.await_count == 3
+        assert pool._idle.qsize() == 2
+
+    async def test_acquire_discards_sandbox_about_to_expire(
+        self, sandbox_create: AsyncMock
+    ) -> None:
+        pool = code_execution._SandboxPool("test-key", None, min_warm=1, lifetime=10)
+        await pool.fill(1)
+        [warm] = sandbox_create.sandboxes
+
+        # 10s of lifetime left is too little for a 30s run
+        sandbox = await pool.acquire(timeout=30)
+        await asyncio.gather(*pool._tasks)
+
+        assert sandbox is not warm
+        assert warm.killed is True
+        # Initial warm-up, one cold start for this run, one replacement warm-up
+        assert sorted(c.kwargs["timeout"] for c in sandbox_create.await_args_list) == [10, 10, 30]
+
+    async def test_warm_failure_is_not_counted(self, sandbox_create: AsyncMock) -> None:
+        sandbox_create.side_effect = ConnectionError("E2B unreachable")
+        pool = code_execution._SandboxPool("test-key", None, min_warm=2, lifetime=300)
+
+        await pool.fill(2)
+
+        assert sandbox_create.await_count == 2
+        assert pool._idle.qsize() == 0
+        assert pool._pending == 0
+
+    async def test_close_cancels_warm_ups_and_kills_idle(self, sandbox_create: AsyncMock) -> None:
+        pool = code_execution._SandboxPool("test-key", None, min_warm=2, lifetime=300)
+        await pool.fill(1)
+        [idle] = sandbox_create.sandboxes
+
+        never = asyncio.Event()
+
+        async def hang(**kwargs: Any) -> FakeSandbox:
+            await never.wait()
+            return FakeSandbox()
+
+        sandbox_create.side_effect = hang
+        pool._replenish(2)
+        warm_ups = list(pool._tasks)
+        await asyncio.sleep(0)
+
+        await pool.close()
+        await asyncio.gather(*warm_ups, return_exceptions=True)
+
+        assert all(task.cancelled() for task in warm_ups)
+        assert idle.killed is True
+        assert pool._idle.qsize() == 0
+        assert pool._pending == 0
+
+
+class TestSandboxRetry:
+    async def test_transient_failure_retried_after_backoff(
+        self, monkeypatch: pytest.MonkeyPatch, recorded_sleeps: list[float]
+    ) -> None:
+        once = AsyncMock(side_effect=[ConnectionError("E2B unreachable"), ("55", "", 0, [])])
+        monkeypatch.setattr(CodeExecutionVerifier, "_run_in_sandbox_once", once)
+
+        result = await CodeExecutionVerifier()._run_in_sandbox("print(55)", "test-key", 30)
+
+        assert result == ("55", "", 0, [])
+        assert once.await_count == 2
+        assert recorded_sleeps == [2]
+
+    async def test_exhausted_retries_raise_last_error(
+        self, monkeypatch: pytest.MonkeyPatch, recorded_sleeps: list[float]
+    ) -> None:
+        errors = [ConnectionError(f"attempt {n}") for n in range(code_execution.SANDBOX_ATTEMPTS)]
+        once = AsyncMock(side_effect=errors)
+        monkeypatch.setattr(CodeExecutionVerifier, "_run_in_sandbox_once", once)
+
+        with pytest.raises(ConnectionError) as exc_info:
+            await CodeExecutionVerifier()._run_in_sandbox("print(55)", "test-key", 30)
+
+        assert exc_info.value is errors[-1]
+        assert once.await_count == code_execution.SANDBOX_ATTEMPTS
+        assert recorded_sleeps == [2] * (code_execution.SANDBOX_ATTEMPTS - 1)
+
+    async def test_cancellation_not_retried(
+        self, monkeypatch: pytest.MonkeyPatch, recorded_sleeps: list[float]
+    ) -> None:
+        once = AsyncMock(side_effect=asyncio.CancelledError)
+        monkeypatch.setattr(CodeExecutionVerifier, "_run_in_sandbox_once", once)
+
+        with pytest.raises(asyncio.CancelledError):
+            await CodeExecutionVerifier()._run_in_sandbox("print(55)", "test-key", 30)
+
+        assert once.await_count == 1
+        assert recorded_sleeps == []
+
+
+class TestPrepareSandbox:
+    async def test_setup_commands_run_as_one_script(self) -> None:
+        sandbox = FakeSandbox()
+
+        await code_execution._prepare_sandbox(sandbox, ["mkdir out", "pip install x"], 30)
+
+        sandbox.commands.run.assert_awaited_once_with(
+            "bash -c 'set -e\nmkdir out\npip install x'", timeout=30
+        )
+
+    async def test_no_setup_commands_is_a_no_op(self) -> None:
+        sandbox = FakeSandbox()
+
+        await code_execution._prepare_sandbox(sandbox, [], 30)
+
+        sandbox.commands.run.assert_not_awaited()
+
+
+class TestSandboxOutput:
+    async def test_streamed_lines_joined_per_stream(self, sandbox_create: AsyncMock) -> None:
+        sandbox = FakeSandbox(stdout=["computing", "55"], stderr=["DeprecationWarning"])
+        sandbox_create.side_effect = None
+        sandbox_create.return_value = sandbox
+
+        result = await CodeExecutionVerifier()._run_in_sandbox_once(
+            "print(55)", "test-key", 30, None, [], []
+        )
+
+        assert result == ("computing\n55", "DeprecationWarning", 0, [])
+        assert sandbox.killed is True
+
+    def test_line_writer_separates_lines_without_trailing_newline(self) -> None:
+        buf = io.StringIO()
+        write = code_execution._line_writer(buf)
+
+        for line in ["a", "", "c"]:
+            write(SimpleNamespace(line=line))
+
+        assert buf.getvalue() == "a\n\nc"
+
+
+class TestMissingFiles:
+    async def test_reports_only_absent_paths(self) -> None:
+        sandbox = FakeSandbox(files=["out/report.csv"])
+
+        missing = await code_execution._missing_files(
+            sandbox, ["out/report.csv", "out/chart.png", "out/log.txt"]
+        )
+
+        assert missing == ["out/chart.png", "out/log.txt"]
+        assert sandbox.files.exists.await_count == 3
+
+    async def test_no_expected_files_skips_the_check(self) -> None:
+        sandbox = FakeSandbox()
+
+        assert await code_execution._missing_files(sandbox, []) == []
+        sandbox.files.exists.assert_not_awaited()
+
+    async def test_missing_files_returned_from_sandbox_run(
+        self, sandbox_create: AsyncMock
+    ) -> None:
+        sandbox_create.side_effect = None
+        sandbox_create.return_value = FakeSandbox(stdout=["55"], files=["out/a.txt"])
+
+        result = await CodeExecutionVerifier()._run_in_sandbox_once(
+            "print(55)", "test-key", 30, None, [], ["out/a.txt", "out/b.txt"]
+        )
+
+        assert result == ("55", "", 0, ["out/b.txt"])
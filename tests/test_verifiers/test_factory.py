@@ -6,6 +6,7 @@ import pytest
 
 from agentic_clearinghouse.verifiers import (
     CodeExecutionVerifier,
+    MockVerifier,
     SchemaVerifier,
     SemanticVerifier,
     VerifierFactory,
@@ -13,29 +14,32 @@ from agentic_clearinghouse.verifiers import (
 
 
 class TestVerifierFactory:
-    def test_create_code_execution(self) -> None:
-        verifier = VerifierFactory.create({"type": "code_execution"})
-        assert isinstance(verifier, CodeExecutionVerifier)
-
-    def test_create_semantic(self) -> None:
-        verifier = VerifierFactory.create({"type": "semantic"})
-        assert isinstance(verifier, SemanticVerifier)
-
-    def test_create_schema(self) -> None:
-        verifier = VerifierFactory.create({"type": "schema"})
-        assert isinstance(verifier, SchemaVerifier)
-
-    def test_unknown_type_raises(self) -> None:
-        with pytest.raises(ValueError, match="Unknown verifier type"):
-            VerifierFactory.create({"type": "quantum_entanglement"})
-
-    def test_missing_type_raises(self) -> None:
-        with pytest.raises(ValueError, match="must contain a 'type' key"):
-            VerifierFactory.create({"timeout": 30})
-
-    def test_empty_dict_raises(self) -> None:
-        with pytest.raises(ValueError):
-            VerifierFactory.create({})
+    @pytest.mark.parametrize(
+        ("config", "verifier_cls"),
+        [
+            ({"type": "code_execution"}, CodeExecutionVerifier),
+            ({"type": "semantic"}, SemanticVerifier),
+            ({"type": "schema"}, SchemaVerifier),
+            ({"type": "mock"}, MockVerifier),
+        ],
+    )
+    def test_create(self, config: dict, verifier_cls: type) -> None:
+        assert isinstance(VerifierFactory.create(config), verifier_cls)
+
+    @pytest.mark.parametrize(
+        ("config", "match"),
+        [
+            ({"type": "quantum_entanglement"}, "Unknown verifier type"),
+            ({"timeout": 30}, "must contain a 'type' key"),
+            ({"type": 0}, "must contain a 'type' key"),
+            ({"type": []}, "must contain a 'type' key"),
+            ({}, None),
+        ],
+        ids=["unknown_type", "missing_type", "zero_type", "empty_list_type", "empty_dict"],
+    )
+    def test_invalid_config_raises(self, config: dict, match: str | None) -> None:
+        with pytest.raises(ValueError, match=match):
+            VerifierFactory.create(config)
 
     def test_get_supported_types(self) -> None:
         types = VerifierFactory.get_supported_types()
@@ -5,25 +5,55 @@ These tests hit real APIs (E2B, Gemini) and require:
     - GEMINI_API_KEY set in .env
 
 Run with:
-    uv run pytest tests/test_verifiers/test_integration.py -v -s
+    uv run pytest tests/test_verifiers/test_integration.py -v -n 0 --log-cli-level=INFO
 
-The -s flag shows stdout so you can see real API responses.
+Gemini verdicts are cached on disk under .pytest_cache, keyed by a hash
+of (model, criteria, payload), so reruns replay them without calling the
+API. Pass --no-llm-cache for a fresh golden run against the real judge.
+
+--log-cli-level=INFO streams the logged API responses live (-n 0 runs
+in-process, since xdist workers don't forward live logs).
 These are marked with @pytest.mark.integration so they can be skipped
 in CI with: pytest -m "not integration"
+
+The calls are I/O-bound, so each provider's scenarios are dispatched
+together with asyncio.gather by a module-scoped fixture; the tests then
+assert on their own scenario's result. Wall time is the slowest round-trip
+rather than the sum of them.
 """
 
 from __future__ import annotations
 
+import asyncio
+import logging
 import os
+import shelve
+from typing import TYPE_CHECKING
 
 import pytest
-
-from agentic_clearinghouse.domain.verifier_protocol import VerificationRequest
-from agentic_clearinghouse.verifiers.code_execution import CodeExecutionVerifier
-from agentic_clearinghouse.verifiers.semantic import SemanticVerifier
-
-# Skip all tests in this module if keys are missing
-pytestmark = pytest.mark.integration
+import pytest_asyncio
+
+from agentic_clearinghouse.config import get_settings
+from agentic_clearinghouse.domain.verifier_protocol import (
+    VerificationRequest,
+    VerificationResult,
+)
+from agentic_clearinghouse.verifiers.code_execution import (
+    CodeExecutionVerifier,
+    close_sandbox_pools,
+    warm_sandbox_pool,
+)
+from agentic_clearinghouse.verifiers.semantic import SemanticVerifier, close_http_client
+from tests.conftest import retry_async
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+logger = logging.getLogger(__name__)
+
+# Skip all tests in this module if keys are missing. The timeout also covers
+# the module fixture that runs every scenario (30s sandbox limit plus one retry)
+pytestmark = [pytest.mark.integration, pytest.mark.timeout(90)]
 
 E2B_KEY = os.environ.get("E2B_API_KEY", "")
 GEMINI_KEY = os.environ.get("GEMINI_API_KEY", "")
@@ -33,17 +63,7 @@ GEMINI_KEY = os.environ.get("GEMINI_API_KEY", "")
 # E2B Code Execution Integration Tests
 # ============================================================
 
-
-@pytest.mark.skipif(not E2B_KEY, reason="E2B_API_KEY not set")
-class TestE2BIntegration:
-    """Test CodeExecutionVerifier against real E2B sandbox."""
-
-    @pytest.mark.asyncio
-    async def test_fibonacci_happy_path(self) -> None:
-        """Scenario A: Worker writes correct Fibonacci code."""
-        verifier = CodeExecutionVerifier(api_key=E2B_KEY)
-
-        fibonacci_code = '''
+FIBONACCI_CODE = '''
 def fibonacci(n):
     if n <= 1:
         return n
@@ -54,57 +74,8 @@ def fibonacci(n):
 
 print(fibonacci(10))
 '''
-        request = VerificationRequest(
-            contract_id="integration-fib-001",
-            payload=fibonacci_code,
-            verification_config={
-                "type": "code_execution",
-                "timeout": 30,
-                "expected_output": "55",
-            },
-        )
-
-        result = await verifier.verify(request)
-
-        print(f"\n  stdout: {result.logs.get('stdout', '')}")
-        print(f"  stderr: {result.logs.get('stderr', '')}")
-        print(f"  is_valid: {result.is_valid}")
-        print(f"  details: {result.details}")
-
-        assert result.is_valid is True
-        assert result.score == 1.0
-
-    @pytest.mark.asyncio
-    async def test_syntax_error_fails(self) -> None:
-        """Worker submits code with a syntax error."""
-        verifier = CodeExecutionVerifier(api_key=E2B_KEY)
-
-        bad_code = "def broken(\n  print('oops')"
-
-        request = VerificationRequest(
-            contract_id="integration-syntax-001",
-            payload=bad_code,
-            verification_config={
-                "type": "code_execution",
-                "timeout": 15,
-                "expected_output": "55",
-            },
-        )
-
-        result = await verifier.verify(request)
-
-        print(f"\n  is_valid: {result.is_valid}")
-        print(f"  details: {result.details}")
-        print(f"  stderr: {result.logs.get('stderr', '')[:200]}")
-
-        assert result.is_valid is False
 
-    @pytest.mark.asyncio
-    async def test_malicious_code_sandboxed(self) -> None:
-        """Scenario C: Worker tries to run malicious code (rm -rf /)."""
-        verifier = CodeExecutionVerifier(api_key=E2B_KEY)
-
-        malicious_code = '''
+MALICIOUS_CODE = '''
 import os
 try:
     os.system("rm -rf /")
@@ -112,49 +83,85 @@ try:
 except Exception as e:
     print(f"blocked: {e}")
 '''
-        request = VerificationRequest(
-            contract_id="integration-malicious-001",
-            payload=malicious_code,
-            verification_config={
-                "type": "code_execution",
-                "timeout": 15,
-                "expected_output": "calculator_result",
-            },
-        )
-
-        result = await verifier.verify(request)
 
-        print(f"\n  is_valid: {result.is_valid}")
-        print(f"  stdout: {result.logs.get('stdout', '')}")
-        print(f"  stderr: {result.logs.get('stderr', '')[:300]}")
 
-        # The code may "run" in the sandbox but won't produce expected output
-        assert result.is_valid is False
+def _code_request(
+    contract_id: str,
+    payload: str,
+    expected_output: str = "55",
+    timeout: int = 15,
+) -> VerificationRequest:
+    return VerificationRequest(
+        contract_id=contract_id,
+        payload=payload,
+        verification_config={
+            "type": "code_execution",
+            "timeout": timeout,
+            "expected_output": expected_output,
+        },
+    )
+
+
+# Scenario name -> (request, expected is_valid)
+E2B_CASES: dict[str, tuple[VerificationRequest, bool]] = {
+    # Scenario A: Worker writes correct Fibonacci code
+    "fibonacci": (_code_request("integration-fib-001", FIBONACCI_CODE, timeout=30), True),
+    # Worker submits code with a syntax error
+    "syntax_error": (
+        _code_request("integration-syntax-001", "def broken(\n  print('oops')"),
+        False,
+    ),
+    # Scenario C: Worker tries to run malicious code (rm -rf /). The code may "run"
+    # in the sandbox but won't produce the expected output
+    "malicious": (
+        _code_request("integration-malicious-001", MALICIOUS_CODE, "calculator_result"),
+        False,
+    ),
+    # Worker submits working code but wrong answer (expected 55)
+    "wrong_output": (_code_request("integration-wrong-001", "print(42)"), False),
+}
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def warm_sandboxes() -> AsyncIterator[None]:
+    """Pre-create one pooled sandbox per scenario so no verification pays a cold start."""
+    with pytest.MonkeyPatch.context() as mp:
+        # The pool is opt-in; the scenarios all run within its lifetime
+        mp.setattr(get_settings(), "e2b_pool_min_warm", 1)
+        await warm_sandbox_pool(E2B_KEY, count=len(E2B_CASES))
+        yield
+        await close_sandbox_pools()
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def e2b_results(warm_sandboxes: None) -> dict[str, VerificationResult]:
+    """Run every E2B scenario concurrently on the warm pool, once per module."""
+    verifier = CodeExecutionVerifier(api_key=E2B_KEY)
+    results = await asyncio.gather(*(verifier.verify(r) for r, _ in E2B_CASES.values()))
+    return dict(zip(E2B_CASES, results, strict=True))
 
-    @pytest.mark.asyncio
-    async def test_wrong_output_fails(self) -> None:
-        """Worker submits working code but wrong answer."""
-        verifier = CodeExecutionVerifier(api_key=E2B_KEY)
 
-        wrong_code = "print(42)"  # Expected 55
+@pytest.mark.skipif(not E2B_KEY, reason="E2B_API_KEY not set")
+class TestE2BIntegration:
+    """Test CodeExecutionVerifier against real E2B sandbox."""
 
-        request = VerificationRequest(
-            contract_id="integration-wrong-001",
-            payload=wrong_code,
-            verification_config={
-                "type": "code_execution",
-                "timeout": 15,
-                "expected_output": "55",
-            },
-        )
+    @pytest.mark.parametrize("scenario", list(E2B_CASES))
+    def test_scenario(self, e2b_results: dict[str, VerificationResult], scenario: str) -> None:
+        result = e2b_results[scenario]
 
-        result = await verifier.verify(request)
+        logger.info("is_valid: %s", result.is_valid)
+        logger.info("details: %s", result.details)
+        logger.info("stdout: %s", result.logs.get("stdout", ""))
+        logger.info("stderr: %s", result.logs.get("stderr", "")[:300])
 
-        print(f"\n  is_valid: {result.is_valid}")
-        print(f"  details: {result.details}")
+        assert result.is_valid is E2B_CASES[scenario][1]
+        if result.is_valid:
+            assert result.score == 1.0
 
-        assert result.is_valid is False
-        assert "doesn't match" in result.details
+    def test_wrong_output_reports_mismatch(
+        self, e2b_results: dict[str, VerificationResult]
+    ) -> None:
+        assert "doesn't match" in e2b_results["wrong_output"].details
 
 
 # ============================================================
@@ -162,89 +169,99 @@ except Exception as e:
 # ============================================================
 
 
+def _semantic_request(contract_id: str, payload: str, criteria: str) -> VerificationRequest:
+    return VerificationRequest(
+        contract_id=contract_id,
+        payload=payload,
+        verification_config={"type": "semantic", "criteria": criteria},
+    )
+
+
+# Scenario name -> (request, expected is_valid)
+GEMINI_CASES: dict[str, tuple[VerificationRequest, bool]] = {
+    # Good tweet passes
+    "tweet": (
+        _semantic_request(
+            "integration-semantic-001",
+            "AI is transforming how we build software. "
+            "From code generation to testing, the developer "
+            "experience will never be the same. #AI #DevTools",
+            "The text should be a tweet about AI and software development. "
+            "It should be under 280 characters and include at least one hashtag.",
+        ),
+        True,
+    ),
+    # Completely off-topic text fails
+    "off_topic": (
+        _semantic_request(
+            "integration-semantic-002",
+            "I had a wonderful pasta dinner last night with extra parmesan.",
+            "The text must be a technical explanation of quantum computing, "
+            "mentioning qubits and superposition.",
+        ),
+        False,
+    ),
+    # Does this poem rhyme?
+    "poem": (
+        _semantic_request(
+            "integration-semantic-003",
+            "Roses are red,\nViolets are blue,\nAI writes the code,\nAnd debugs it too.",
+            "The text must be a short poem that rhymes (AABB or ABAB pattern).",
+        ),
+        True,
+    ),
+}
+
+
+def _rate_limited(result: VerificationResult) -> bool:
+    """Only a judge call rejected by the provider's rate limiter is worth retrying."""
+    details = result.details.lower()
+    return result.error == "LLM_JUDGE_ERROR" and ("rate limit" in details or "429" in details)
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def gemini_results(
+    request: pytest.FixtureRequest,
+) -> AsyncIterator[dict[str, VerificationResult]]:
+    """Run every Gemini scenario concurrently, once per module.
+
+    Verdicts are served from the on-disk cache unless --no-llm-cache is given,
+    and a rate-limited judge call is retried rather than failing the run.
+    """
+    use_cache = not request.config.getoption("--no-llm-cache")
+    cache_path = request.config.cache.mkdir("llm") / "verdicts"
+    with shelve.open(str(cache_path)) as verdicts:
+        verifier = SemanticVerifier(
+            model="gemini/gemini-2.0-flash",
+            use_cache=use_cache,
+            verdict_cache=verdicts,
+        )
+        results = await asyncio.gather(
+            *(
+                retry_async(lambda r=r: verifier.verify(r), _rate_limited)
+                for r, _ in GEMINI_CASES.values()
+            )
+        )
+    yield dict(zip(GEMINI_CASES, results, strict=True))
+    await close_http_client()
+
+
 @pytest.mark.skipif(not GEMINI_KEY, reason="GEMINI_API_KEY not set")
 class TestGeminiIntegration:
     """Test SemanticVerifier against real Gemini API."""
 
-    @pytest.mark.asyncio
-    async def test_tweet_meets_criteria(self) -> None:
-        """Semantic check: good tweet passes."""
-        verifier = SemanticVerifier(model="gemini/gemini-2.0-flash")
-
-        request = VerificationRequest(
-            contract_id="integration-semantic-001",
-            payload=(
-                "AI is transforming how we build software. "
-                "From code generation to testing, the developer "
-                "experience will never be the same. #AI #DevTools"
-            ),
-            verification_config={
-                "type": "semantic",
-                "criteria": (
-                    "The text should be a tweet about AI and software development. "
-                    "It should be under 280 characters and include at least one hashtag."
-                ),
-            },
-        )
+    @pytest.mark.parametrize("scenario", list(GEMINI_CASES))
+    def test_scenario(self, gemini_results: dict[str, VerificationResult], scenario: str) -> None:
+        result = gemini_results[scenario]
+
+        logger.info("is_valid: %s", result.is_valid)
+        logger.info("score: %s", result.score)
+        logger.info("details: %s", result.details[:200])
 
-        result = await verifier.verify(request)
+        assert result.is_valid is GEMINI_CASES[scenario][1]
 
-        print(f"\n  is_valid: {result.is_valid}")
-        print(f"  score: {result.score}")
-        print(f"  details: {result.details[:200]}")
+    def test_tweet_scores_above_half(self, gemini_results: dict[str, VerificationResult]) -> None:
+        result = gemini_results["tweet"]
 
-        assert result.is_valid is True
         assert result.score is not None
         assert result.score > 0.5
-
-    @pytest.mark.asyncio
-    async def test_off_topic_fails(self) -> None:
-        """Semantic check: completely off-topic text fails."""
-        verifier = SemanticVerifier(model="gemini/gemini-2.0-flash")
-
-        request = VerificationRequest(
-            contract_id="integration-semantic-002",
-            payload="I had a wonderful pasta dinner last night with extra parmesan.",
-            verification_config={
-                "type": "semantic",
-                "criteria": (
-                    "The text must be a technical explanation of quantum computing, "
-                    "mentioning qubits and superposition."
-                ),
-            },
-        )
-
-        result = await verifier.verify(request)
-
-        print(f"\n  is_valid: {result.is_valid}")
-        print(f"  score: {result.score}")
-        print(f"  details: {result.details[:200]}")
-
-        assert result.is_valid is False
-
-    @pytest.mark.asyncio
-    async def test_rhyming_poem(self) -> None:
-        """Semantic check: does this poem rhyme?"""
-        verifier = SemanticVerifier(model="gemini/gemini-2.0-flash")
-
-        request = VerificationRequest(
-            contract_id="integration-semantic-003",
-            payload=(
-                "Roses are red,\n"
-                "Violets are blue,\n"
-                "AI writes the code,\n"
-                "And debugs it too."
-            ),
-            verification_config={
-                "type": "semantic",
-                "criteria": "The text must be a short poem that rhymes (AABB or ABAB pattern).",
-            },
-        )
-
-        result = await verifier.verify(request)
-
-        print(f"\n  is_valid: {result.is_valid}")
-        print(f"  score: {result.score}")
-        print(f"  details: {result.details[:200]}")
-
-        assert result.is_valid is True
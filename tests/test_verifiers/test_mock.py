@@ -0,0 +1,65 @@
+"""Unit tests for the MockVerifier (dry-run mode)."""
+
+from __future__ import annotations
+
+import pytest
+
+from agentic_clearinghouse.domain.verifier_protocol import VerificationRequest
+from agentic_clearinghouse.verifiers import MockVerifier
+
+
+def _make_request(**config: object) -> VerificationRequest:
+    return VerificationRequest(
+        contract_id="test-contract-004",
+        payload="anything",
+        verification_config={"type": "mock", **config},
+    )
+
+
+class TestMockVerifier:
+    async def test_default_passes(self) -> None:
+        result = await MockVerifier().verify(_make_request())
+
+        assert result.is_valid is True
+        assert result.score == 1.0
+        assert result.logs == {"mode": "dry-run", "verifier": "mock"}
+
+    async def test_should_pass_false_fails(self) -> None:
+        result = await MockVerifier().verify(_make_request(should_pass=False))
+
+        assert result.is_valid is False
+        assert result.score == 0.0
+        assert "failed" in result.details
+
+    def test_default_config_reuses_prebuilt_result(self) -> None:
+        verifier = MockVerifier()
+        first = verifier.verify_sync(_make_request(should_pass=True))
+        second = verifier.verify_sync(_make_request())
+
+        assert first is second
+
+    def test_shared_result_logs_cannot_be_corrupted(self) -> None:
+        verifier = MockVerifier()
+        first = verifier.verify_sync(_make_request())
+
+        first.to_dict()["logs"]["mode"] = "tampered"
+        with pytest.raises(TypeError):
+            first.logs["mode"] = "tampered"  # type: ignore[index]
+
+        assert verifier.verify_sync(_make_request()).logs == {"mode": "dry-run", "verifier": "mock"}
+
+    def test_non_bool_should_pass_takes_general_path(self) -> None:
+        result = MockVerifier().verify_sync(_make_request(should_pass=[]))
+
+        assert not result.is_valid
+        assert result.score == 0.0
+        assert "failed" in result.details
+
+    def test_custom_score_and_details(self) -> None:
+        result = MockVerifier().verify_sync(
+            _make_request(should_pass=True, score=0.7, details="custom")
+        )
+
+        assert result.is_valid is True
+        assert result.score == 0.7
+        assert result.details == "custom"
@@ -10,10 +10,17 @@ Tests cover:
 
 from __future__ import annotations
 
+import json
+
 import pytest
 
 from agentic_clearinghouse.domain.verifier_protocol import VerificationRequest
-from agentic_clearinghouse.verifiers.schema_validator import SchemaVerifier
+from agentic_clearinghouse.verifiers import schema_validator
+from agentic_clearinghouse.verifiers.schema_validator import (
+    SchemaVerifier,
+    _get_fast_validator,
+    _get_validator,
+)
 
 # --- Test fixtures ---
 
@@ -28,6 +35,10 @@ USER_SCHEMA = {
 }
 
 
+ALICE_30 = '{"name": "Alice", "age": 30}'
+ALICE_30_OBJ = json.loads(ALICE_30)
+
+
 def _make_request(payload: str, schema: dict | None = USER_SCHEMA) -> VerificationRequest:
     return VerificationRequest(
         contract_id="test-contract-001",
@@ -37,23 +48,25 @@ def _make_request(payload: str, schema: dict | None = USER_SCHEMA) -> Verificati
     )
 
 
+@pytest.fixture(scope="module")
+def verifier() -> SchemaVerifier:
+    """SchemaVerifier is stateless, so one instance serves the whole module."""
+    return SchemaVerifier()
+
+
 # --- Tests ---
 
 
 class TestSchemaVerifierHappyPath:
-    @pytest.mark.asyncio
-    async def test_valid_json_passes(self) -> None:
-        verifier = SchemaVerifier()
-        request = _make_request('{"name": "Alice", "age": 30}')
+    async def test_valid_json_passes(self, verifier: SchemaVerifier) -> None:
+        request = _make_request(ALICE_30)
         result = await verifier.verify(request)
 
         assert result.is_valid is True
         assert result.score == 1.0
         assert "successfully validated" in result.details
 
-    @pytest.mark.asyncio
-    async def test_valid_json_with_optional_fields(self) -> None:
-        verifier = SchemaVerifier()
+    async def test_valid_json_with_optional_fields(self, verifier: SchemaVerifier) -> None:
         request = _make_request(
             '{"name": "Bob", "age": 25, "email": "bob@example.com"}'
         )
@@ -61,10 +74,8 @@ class TestSchemaVerifierHappyPath:
 
         assert result.is_valid is True
 
-    @pytest.mark.asyncio
-    async def test_valid_json_with_extra_fields(self) -> None:
+    async def test_valid_json_with_extra_fields(self, verifier: SchemaVerifier) -> None:
         """Extra fields are allowed by default in JSON Schema."""
-        verifier = SchemaVerifier()
         request = _make_request(
             '{"name": "Charlie", "age": 40, "phone": "555-1234"}'
         )
@@ -72,11 +83,20 @@ class TestSchemaVerifierHappyPath:
 
         assert result.is_valid is True
 
+    async def test_pre_parsed_payload_skips_parse(
+        self, verifier: SchemaVerifier, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        def fail_parse(payload: str) -> None:
+            raise AssertionError("payload was re-parsed")
+
+        monkeypatch.setattr(schema_validator, "_parse_payload", fail_parse)
+        result = await verifier.verify(_make_request(ALICE_30), payload_obj=ALICE_30_OBJ)
+
+        assert result.is_valid is True
+
 
 class TestSchemaVerifierFailures:
-    @pytest.mark.asyncio
-    async def test_missing_required_field(self) -> None:
-        verifier = SchemaVerifier()
+    async def test_missing_required_field(self, verifier: SchemaVerifier) -> None:
         request = _make_request('{"name": "Alice"}')  # missing "age"
         result = await verifier.verify(request)
 
@@ -86,26 +106,20 @@ class TestSchemaVerifierFailures:
         assert len(errors) == 1
         assert "age" in errors[0]["message"]
 
-    @pytest.mark.asyncio
-    async def test_wrong_type(self) -> None:
-        verifier = SchemaVerifier()
+    async def test_wrong_type(self, verifier: SchemaVerifier) -> None:
         request = _make_request('{"name": "Alice", "age": "thirty"}')
         result = await verifier.verify(request)
 
         assert result.is_valid is False
         assert result.logs["validation_errors"]
 
-    @pytest.mark.asyncio
-    async def test_negative_age(self) -> None:
-        verifier = SchemaVerifier()
+    async def test_negative_age(self, verifier: SchemaVerifier) -> None:
         request = _make_request('{"name": "Alice", "age": -5}')
         result = await verifier.verify(request)
 
         assert result.is_valid is False
 
-    @pytest.mark.asyncio
-    async def test_multiple_errors(self) -> None:
-        verifier = SchemaVerifier()
+    async def test_multiple_errors(self, verifier: SchemaVerifier) -> None:
         request = _make_request('{"age": "not_a_number"}')  # missing name + wrong type
         result = await verifier.verify(request)
 
@@ -114,37 +128,79 @@ class TestSchemaVerifierFailures:
 
 
 class TestSchemaVerifierEdgeCases:
-    @pytest.mark.asyncio
-    async def test_malformed_json(self) -> None:
-        verifier = SchemaVerifier()
+    async def test_malformed_json(self, verifier: SchemaVerifier) -> None:
         request = _make_request('{"name": "Alice", "age":}')  # invalid JSON
         result = await verifier.verify(request)
 
         assert result.is_valid is False
         assert result.error == "INVALID_JSON"
 
-    @pytest.mark.asyncio
-    async def test_empty_string_payload(self) -> None:
-        verifier = SchemaVerifier()
+    async def test_empty_string_payload(self, verifier: SchemaVerifier) -> None:
         request = _make_request("")
         result = await verifier.verify(request)
 
         assert result.is_valid is False
         assert result.error == "INVALID_JSON"
 
-    @pytest.mark.asyncio
-    async def test_missing_schema(self) -> None:
-        verifier = SchemaVerifier()
+    async def test_missing_schema(self, verifier: SchemaVerifier) -> None:
         request = _make_request('{"name": "Alice"}', schema=None)
         result = await verifier.verify(request)
 
         assert result.is_valid is False
         assert result.error == "MISSING_SCHEMA"
 
-    @pytest.mark.asyncio
-    async def test_array_payload_against_object_schema(self) -> None:
-        verifier = SchemaVerifier()
+    async def test_array_payload_against_object_schema(self, verifier: SchemaVerifier) -> None:
         request = _make_request('[1, 2, 3]')
         result = await verifier.verify(request)
 
         assert result.is_valid is False
+
+    async def test_validator_reused_across_key_order(self, verifier: SchemaVerifier) -> None:
+        """Equivalent schemas share one compiled validator regardless of key order."""
+        reordered = dict(reversed(list(USER_SCHEMA.items())))
+        await verifier.verify(_make_request(ALICE_30))
+        hits_before = _get_fast_validator.cache_info().hits
+        result = await verifier.verify(_make_request('{"name": "Bob", "age": 5}', reordered))
+
+        assert result.is_valid is True
+        assert _get_fast_validator.cache_info().hits == hits_before + 1
+
+    async def test_diagnostic_validator_only_built_on_failure(
+        self, verifier: SchemaVerifier
+    ) -> None:
+        """Valid payloads are accepted by the compiled tier alone; jsonschema is the slow path."""
+        schema = {**USER_SCHEMA, "title": "diagnostic-tier"}
+        misses_before = _get_validator.cache_info().misses
+
+        passed = await verifier.verify(_make_request(ALICE_30, schema))
+        assert passed.is_valid is True
+        assert _get_validator.cache_info().misses == misses_before
+
+        failed = await verifier.verify(_make_request('{"name": "Alice"}', schema))
+        assert failed.is_valid is False
+        assert failed.logs["validation_errors"][0]["message"] == "'age' is a required property"
+        assert _get_validator.cache_info().misses == misses_before + 1
+
+    async def test_invalid_schema_definition(self, verifier: SchemaVerifier) -> None:
+        request = _make_request('{"name": "Alice"}', schema={"type": 5})
+        result = await verifier.verify(request)
+
+        assert result.is_valid is False
+        assert result.error == "INVALID_SCHEMA"
+
+    async def test_defaults_not_injected_into_payload(self, verifier: SchemaVerifier) -> None:
+        properties = {**USER_SCHEMA["properties"], "role": {"type": "string", "default": "user"}}
+        schema = {**USER_SCHEMA, "properties": properties}
+        request = _make_request(ALICE_30, schema)
+        request.verification_config["verbose_logs"] = True
+        result = await verifier.verify(request)
+
+        assert result.is_valid is True
+        assert "role" not in result.logs["parsed_payload"]
+
+    async def test_success_logs_fingerprint_only_by_default(self, verifier: SchemaVerifier) -> None:
+        payload = ALICE_30
+        result = await verifier.verify(_make_request(payload))
+
+        assert set(result.logs) == {"schema_hash", "payload_bytes"}
+        assert result.logs["payload_bytes"] == len(payload)
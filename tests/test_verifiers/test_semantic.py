@@ -6,11 +6,15 @@ without hitting a real LLM API.
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, MagicMock, patch
+import asyncio
+import re
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from agentic_clearinghouse.domain.verifier_protocol import VerificationRequest
+from agentic_clearinghouse.verifiers import semantic
 from agentic_clearinghouse.verifiers.semantic import SemanticVerifier
 
 
@@ -25,17 +29,32 @@ def _make_request(
     )
 
 
-def _mock_llm_response(content: str) -> MagicMock:
-    """Create a mock LiteLLM completion response."""
-    mock_resp = MagicMock()
-    mock_resp.choices = [MagicMock()]
-    mock_resp.choices[0].message.content = content
-    return mock_resp
+# Shared by tests that only read the request; tests that edit verification_config
+# build their own with _make_request()
+DEFAULT_REQUEST = _make_request()
+
+
+def _mock_llm_response(content: str) -> SimpleNamespace:
+    """Create a stand-in LiteLLM completion response (only .choices[0].message.content is read)."""
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+# Canonical judge replies, built once and shared by the tests that don't care about the wording
+PASS_RESPONSE = _mock_llm_response("VERDICT: TRUE\nSCORE: 0.9\nREASONING: Ok.")
+FAIL_RESPONSE = _mock_llm_response("VERDICT: FALSE\nSCORE: 0.2\nREASONING: Off.")
+
+
+@pytest.fixture
+def mocked_litellm(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Replace litellm; tests set acompletion.return_value / side_effect directly."""
+    mock = MagicMock()
+    mock.acompletion = AsyncMock()
+    monkeypatch.setattr(semantic, "litellm", mock)
+    return mock
 
 
 class TestSemanticVerifierParsing:
-    @pytest.mark.asyncio
-    async def test_true_verdict_parsed(self) -> None:
+    async def test_true_verdict_parsed(self, mocked_litellm: MagicMock) -> None:
         verifier = SemanticVerifier()
         llm_output = (
             "VERDICT: TRUE\n"
@@ -43,18 +62,14 @@ class TestSemanticVerifierParsing:
             "REASONING: The tweet is concise, about AI, and under 280 characters."
         )
 
-        with patch("agentic_clearinghouse.verifiers.semantic.litellm") as mock_litellm:
-            mock_litellm.acompletion = AsyncMock(
-                return_value=_mock_llm_response(llm_output)
-            )
-            result = await verifier.verify(_make_request())
+        mocked_litellm.acompletion.return_value = _mock_llm_response(llm_output)
+        result = await verifier.verify(DEFAULT_REQUEST)
 
         assert result.is_valid is True
         assert result.score == 0.95
         assert "concise" in result.details
 
-    @pytest.mark.asyncio
-    async def test_false_verdict_parsed(self) -> None:
+    async def test_false_verdict_parsed(self, mocked_litellm: MagicMock) -> None:
         verifier = SemanticVerifier()
         llm_output = (
             "VERDICT: FALSE\n"
@@ -62,38 +77,27 @@ class TestSemanticVerifierParsing:
             "REASONING: The text is not related to AI at all."
         )
 
-        with patch("agentic_clearinghouse.verifiers.semantic.litellm") as mock_litellm:
-            mock_litellm.acompletion = AsyncMock(
-                return_value=_mock_llm_response(llm_output)
-            )
-            result = await verifier.verify(_make_request(payload="I love pizza"))
+        mocked_litellm.acompletion.return_value = _mock_llm_response(llm_output)
+        result = await verifier.verify(_make_request(payload="I love pizza"))
 
         assert result.is_valid is False
         assert result.score == 0.2
 
-    @pytest.mark.asyncio
-    async def test_score_clamped_to_bounds(self) -> None:
+    async def test_score_clamped_to_bounds(self, mocked_litellm: MagicMock) -> None:
         verifier = SemanticVerifier()
         llm_output = "VERDICT: TRUE\nSCORE: 1.5\nREASONING: Excellent work."
 
-        with patch("agentic_clearinghouse.verifiers.semantic.litellm") as mock_litellm:
-            mock_litellm.acompletion = AsyncMock(
-                return_value=_mock_llm_response(llm_output)
-            )
-            result = await verifier.verify(_make_request())
+        mocked_litellm.acompletion.return_value = _mock_llm_response(llm_output)
+        result = await verifier.verify(DEFAULT_REQUEST)
 
         assert result.score == 1.0  # Clamped from 1.5
 
-    @pytest.mark.asyncio
-    async def test_malformed_response_defaults_to_fail(self) -> None:
+    async def test_malformed_response_defaults_to_fail(self, mocked_litellm: MagicMock) -> None:
         verifier = SemanticVerifier()
         llm_output = "I think it's pretty good but I'm not sure."
 
-        with patch("agentic_clearinghouse.verifiers.semantic.litellm") as mock_litellm:
-            mock_litellm.acompletion = AsyncMock(
-                return_value=_mock_llm_response(llm_output)
-            )
-            result = await verifier.verify(_make_request())
+        mocked_litellm.acompletion.return_value = _mock_llm_response(llm_output)
+        result = await verifier.verify(DEFAULT_REQUEST)
 
         # No VERDICT: TRUE found -> defaults to False
         assert result.is_valid is False
@@ -101,7 +105,6 @@ class TestSemanticVerifierParsing:
 
 
 class TestSemanticVerifierErrors:
-    @pytest.mark.asyncio
     async def test_missing_criteria(self) -> None:
         verifier = SemanticVerifier()
         request = VerificationRequest(
@@ -114,34 +117,161 @@ class TestSemanticVerifierErrors:
         assert result.is_valid is False
         assert result.error == "MISSING_CRITERIA"
 
-    @pytest.mark.asyncio
-    async def test_llm_api_failure(self) -> None:
+    async def test_llm_api_failure(self, mocked_litellm: MagicMock) -> None:
         verifier = SemanticVerifier()
 
-        with patch("agentic_clearinghouse.verifiers.semantic.litellm") as mock_litellm:
-            mock_litellm.acompletion = AsyncMock(
-                side_effect=Exception("API rate limit exceeded")
-            )
-            result = await verifier.verify(_make_request())
+        mocked_litellm.acompletion.side_effect = Exception("API rate limit exceeded")
+        result = await verifier.verify(DEFAULT_REQUEST)
 
         assert result.is_valid is False
         assert result.error == "LLM_JUDGE_ERROR"
         assert "rate limit" in result.details
 
-    @pytest.mark.asyncio
-    async def test_empty_llm_response(self) -> None:
+    async def test_empty_llm_response(self, mocked_litellm: MagicMock) -> None:
         verifier = SemanticVerifier()
 
-        with patch("agentic_clearinghouse.verifiers.semantic.litellm") as mock_litellm:
-            mock_litellm.acompletion = AsyncMock(
-                return_value=_mock_llm_response("")
-            )
-            # Empty content raises ValueError in _call_llm
-            result = await verifier.verify(_make_request())
+        mocked_litellm.acompletion.return_value = _mock_llm_response("")
+        # Empty content raises ValueError in _call_llm
+        result = await verifier.verify(DEFAULT_REQUEST)
 
         assert result.is_valid is False
 
 
+class TestJudgeHttpClient:
+    async def test_client_reused_on_same_loop(
+        self, mocked_litellm: MagicMock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(semantic, "_http_client", None)
+        await semantic._ensure_http_client()
+        client = semantic._http_client
+        await semantic._ensure_http_client()
+
+        assert semantic._http_client is client
+        assert mocked_litellm.aclient_session is client
+        await semantic.close_http_client()
+
+    async def test_loop_change_closes_previous_client(
+        self, mocked_litellm: MagicMock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        stale = MagicMock(aclose=AsyncMock())
+        old_loop = asyncio.new_event_loop()
+        old_loop.close()
+        monkeypatch.setattr(semantic, "_http_client", stale)
+        monkeypatch.setattr(semantic, "_http_client_loop", old_loop)
+
+        await semantic._ensure_http_client()
+
+        stale.aclose.assert_awaited_once()
+        assert semantic._http_client is not stale
+        assert mocked_litellm.aclient_session is semantic._http_client
+        await semantic.close_http_client()
+
+
+class TestSemanticVerifierRetry:
+    async def test_transient_failure_retried_after_backoff(
+        self, mocked_litellm: MagicMock, recorded_sleeps: list[float]
+    ) -> None:
+        mocked_litellm.acompletion.side_effect = [ConnectionError("reset"), PASS_RESPONSE]
+
+        response = await SemanticVerifier()._call_llm("criteria", "payload")
+
+        assert response.startswith("VERDICT: TRUE")
+        assert mocked_litellm.acompletion.await_count == 2
+        assert recorded_sleeps == [2]
+
+    async def test_exhausted_retries_raise_last_error(
+        self, mocked_litellm: MagicMock, recorded_sleeps: list[float]
+    ) -> None:
+        errors = [ConnectionError(f"attempt {n}") for n in range(semantic.LLM_ATTEMPTS)]
+        mocked_litellm.acompletion.side_effect = errors
+
+        with pytest.raises(ConnectionError) as exc_info:
+            await SemanticVerifier()._call_llm("criteria", "payload")
+
+        assert exc_info.value is errors[-1]
+        assert mocked_litellm.acompletion.await_count == semantic.LLM_ATTEMPTS
+        assert recorded_sleeps == [2] * (semantic.LLM_ATTEMPTS - 1)
+
+    async def test_cancellation_not_retried(
+        self, mocked_litellm: MagicMock, recorded_sleeps: list[float]
+    ) -> None:
+        mocked_litellm.acompletion.side_effect = asyncio.CancelledError
+
+        with pytest.raises(asyncio.CancelledError):
+            await SemanticVerifier()._call_llm("criteria", "payload")
+
+        assert mocked_litellm.acompletion.await_count == 1
+        assert recorded_sleeps == []
+
+
+class TestSemanticVerifierInFlight:
+    async def test_concurrent_identical_requests_share_one_call(
+        self, mocked_litellm: MagicMock
+    ) -> None:
+        verifier = SemanticVerifier()
+
+        async def slow_completion(**kwargs: object) -> SimpleNamespace:
+            await asyncio.sleep(0.01)
+            return PASS_RESPONSE
+
+        mocked_litellm.acompletion.side_effect = slow_completion
+        results = await asyncio.gather(
+            verifier.verify(DEFAULT_REQUEST),
+            verifier.verify(DEFAULT_REQUEST),
+        )
+
+        assert mocked_litellm.acompletion.await_count == 1
+        assert all(r.is_valid for r in results)
+
+
+class TestSemanticVerifierCache:
+    async def test_repeat_verdict_served_from_cache(self, mocked_litellm: MagicMock) -> None:
+        verifier = SemanticVerifier()
+
+        mocked_litellm.acompletion.return_value = FAIL_RESPONSE
+        first = await verifier.verify(DEFAULT_REQUEST)
+        second = await verifier.verify(DEFAULT_REQUEST)
+
+        assert mocked_litellm.acompletion.await_count == 1
+        assert second.to_dict() == first.to_dict()
+
+    async def test_use_cache_false_always_calls_llm(self, mocked_litellm: MagicMock) -> None:
+        verifier = SemanticVerifier(use_cache=False)
+
+        mocked_litellm.acompletion.return_value = PASS_RESPONSE
+        await verifier.verify(DEFAULT_REQUEST)
+        await verifier.verify(DEFAULT_REQUEST)
+
+        assert mocked_litellm.acompletion.await_count == 2
+
+    async def test_unparsed_verdict_not_cached(self, mocked_litellm: MagicMock) -> None:
+        verifier = SemanticVerifier()
+
+        mocked_litellm.acompletion.side_effect = [
+            _mock_llm_response("I think this mostly works."),
+            PASS_RESPONSE,
+        ]
+        first = await verifier.verify(DEFAULT_REQUEST)
+        second = await verifier.verify(DEFAULT_REQUEST)
+
+        assert mocked_litellm.acompletion.await_count == 2
+        assert first.is_valid is False
+        assert second.is_valid is True
+
+    async def test_injected_verdict_cache_shared_across_verifiers(
+        self, mocked_litellm: MagicMock
+    ) -> None:
+        store: dict = {}
+
+        mocked_litellm.acompletion.return_value = PASS_RESPONSE
+        first = await SemanticVerifier(verdict_cache=store).verify(DEFAULT_REQUEST)
+        second = await SemanticVerifier(verdict_cache=store).verify(DEFAULT_REQUEST)
+
+        assert mocked_litellm.acompletion.await_count == 1
+        assert len(store) == 1
+        assert second.to_dict() == first.to_dict()
+
+
 class TestResponseParsing:
     """Test the _parse_response method directly."""
 
@@ -168,3 +298,21 @@ class TestResponseParsing:
         verifier = SemanticVerifier()
         _, score, _ = verifier._parse_response("VERDICT: TRUE\nSCORE: not_a_number\nREASONING: ok")
         assert score == 0.0
+
+    def test_multiline_reasoning(self) -> None:
+        verifier = SemanticVerifier()
+        _, score, reasoning = verifier._parse_response(
+            "VERDICT: TRUE\nREASONING:\nFirst point.\nSecond point.\nSCORE: 0.7"
+        )
+        assert reasoning == "First point.\nSecond point."
+        assert score == 0.7
+
+    def test_parsing_uses_precompiled_pattern(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Parsing must only go through the module-level _JUDGE_FIELD_RE, never ad-hoc re calls."""
+        assert isinstance(semantic._JUDGE_FIELD_RE, re.Pattern)
+        monkeypatch.setattr(semantic, "re", None)
+
+        verdict, score, reasoning = SemanticVerifier()._parse_response(
+            "VERDICT: TRUE\nSCORE: 0.7\nREASONING: Fine."
+        )
+        assert (verdict, score, reasoning) == (True, 0.7, "Fine.")